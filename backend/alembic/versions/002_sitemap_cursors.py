@@ -0,0 +1,28 @@
+"""Sitemap crawl cursors
+
+Revision ID: 002_sitemap_cursors
+Revises: 001_initial
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '002_sitemap_cursors'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sitemap_cursors',
+        sa.Column('domain', sa.String(255), primary_key=True),
+        sa.Column('high_water_mark', sa.DateTime),
+        sa.Column('updated_at', sa.DateTime, default=sa.func.now(), onupdate=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sitemap_cursors')
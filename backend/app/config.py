@@ -45,6 +45,60 @@ class Settings(BaseSettings):
     brightdata_username: str = ""
     brightdata_password: str = ""
     brightdata_host: str = "brd.superproxy.io:22225"
+    proxy_session_format: str = "{username}-session-{session}"  # sticky exit IP
+    proxy_sessions_per_domain: int = 2
+    proxy_min_requests: int = 5  # before a session can be retired
+    proxy_max_error_rate: float = 0.3
+    proxy_max_latency_seconds: float = 8.0
+    
+    # Harvester
+    scraper_max_connections_per_host: int = 6
+    scraper_keepalive_expiry: float = 60.0
+    scraper_http2: bool = True
+    harvest_global_concurrency: int = 16
+    harvest_domain_rate: float = 0.5  # requests per second per outlet
+    harvest_domain_burst: float = 2
+    harvest_domain_max_in_flight: int = 2
+    browser_max_contexts: int = 2
+    browser_pages_per_context: int = 4
+    browser_max_page_uses: int = 20
+    playwright_block_resources: bool = True  # images, media, fonts, ad/analytics hosts
+    playwright_fast_load: bool = True  # wait for content selectors, not network idle
+    playwright_content_timeout_ms: int = 15000
+    known_url_window_days: int = 30  # stored URLs preloaded per harvest run
+    harvest_parse_workers: Optional[int] = None  # None = one per core, 0 = inline
+    harvest_parse_max_pending: int = 32
+    harvest_ingest_batch_size: int = 100  # articles per bulk INSERT
+    harvest_discovery_mode: str = "search"  # "search" per topic, or "sweep" feeds/sections once
+    harvest_articles_per_topic: int = 3  # per outlet
+    harvest_frontier_enabled: bool = False  # spread the daily harvest over crawl_frontier workers
+    frontier_workers: int = 4  # crawl_frontier tasks dispatched per run
+    frontier_worker_concurrency: int = 8  # items each worker fetches at once
+    frontier_lease_seconds: float = 300.0  # unfinished items are requeued after this
+    frontier_commit_seconds: float = 30.0  # longest a fetched article waits for its batch write
+    fetch_mode_window: int = 20  # recent HTTP results per outlet and page type
+    fetch_mode_min_samples: int = 5  # HTTP results needed before starting in the browser
+    fetch_mode_min_success_rate: float = 0.5  # below this, start in the browser
+    fetch_mode_probe_every: int = 10  # browser-first fetches between HTTP probes
+    article_min_headline_chars: int = 15
+    article_min_body_chars: int = 500
+    health_failure_threshold: int = 5  # consecutive failures that open an outlet's circuit
+    health_cooldown_seconds: float = 60.0  # doubles on each failed probe
+    health_max_cooldown_seconds: float = 900.0
+    archive_enabled: bool = False  # keep raw fetched pages for offline re-extraction
+    archive_dir: str = "data/archive"  # relative to the worker's working directory
+    archive_retention_days: int = 14  # older pages are pruned when a run starts
+    archive_level: int = 10  # zstd level
+    search_cache_enabled: bool = True  # reuse search result URL lists (Redis)
+    search_cache_ttl_seconds: int = 3 * 3600
+    search_cache_stale_seconds: int = 21 * 3600  # served while refreshing
+    
+    # Discovery
+    discovery_feed_timeout_seconds: float = 10.0  # per feed; late feeds keep what arrived
+    discovery_nlp_batch_size: int = 256  # feed items per nlp.pipe batch
+    discovery_nlp_n_process: int = 1  # >1 forks spaCy worker processes; 1 inside Celery prefork children
+    discovery_cache_enabled: bool = True  # conditional feed GETs + per-item entity cache
+    discovery_cache_path: str = "data/discovery_cache.sqlite3"
     
     @property
     def is_production(self) -> bool:
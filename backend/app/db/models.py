@@ -237,3 +237,16 @@ class ScoringAudit(Base):
     model_used: Mapped[str] = mapped_column(String(50))
     processed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     processing_time_ms: Mapped[int] = mapped_column(Integer)
+
+
+class SitemapCursor(Base):
+    """Per-outlet high-water mark for news sitemap crawls"""
+    __tablename__ = "sitemap_cursors"
+    
+    domain: Mapped[str] = mapped_column(String(255), primary_key=True)
+    high_water_mark: Mapped[Optional[datetime]] = mapped_column(DateTime)  # newest <lastmod> seen
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, 
+        default=datetime.utcnow, 
+        onupdate=datetime.utcnow
+    )
@@ -0,0 +1,350 @@
+"""
+Raw Page Archive
+
+Every page the harvester fetches is kept on local disk so extractor and
+classifier changes can be replayed without re-crawling through the proxy.
+
+Objects are content-addressed by the SHA-256 of the raw bytes (identical
+pages are stored once) and zstd-compressed, optionally with a dictionary
+trained on an outlet's own pages, since pages from one site share most of
+their markup. A SQLite index maps URL and fetch time to objects.
+Several worker processes can share one archive. prune() drops pages
+past the retention window and any objects no page refers to any more.
+
+    <root>/objects/ab/abcdef....zst
+    <root>/dicts/<dict_id>.zdict
+    <root>/index.sqlite3
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    # Archive still works, just with zlib and no dictionaries
+    zstandard = None
+
+
+@dataclass
+class ArchivedPage:
+    url: str
+    domain: str
+    kind: str  # "article", "search" or "listing"
+    fetched_at: datetime
+    sha256: str
+    encoding: Optional[str] = None
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    sha256 TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    dict_id INTEGER,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    sha256 TEXT NOT NULL REFERENCES objects(sha256),
+    encoding TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_pages_url ON pages(url, fetched_at);
+CREATE INDEX IF NOT EXISTS ix_pages_domain ON pages(domain, kind, fetched_at);
+CREATE TABLE IF NOT EXISTS dictionaries (
+    dict_id INTEGER PRIMARY KEY,
+    domain TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    samples INTEGER NOT NULL
+);
+"""
+
+
+class PageArchive:
+    """Content-addressed, compressed store of raw fetched pages"""
+
+    def __init__(self, root: str, level: int = 10, read_only: bool = False):
+        self.root = Path(root)
+        self.level = level
+        self.read_only = read_only
+        if not read_only:
+            (self.root / "objects").mkdir(parents=True, exist_ok=True)
+            (self.root / "dicts").mkdir(parents=True, exist_ok=True)
+
+        # Writes come from worker threads; one lock covers the index and
+        # the (not thread-safe) compressors
+        self._lock = threading.Lock()
+        index = self.root / "index.sqlite3"
+        if read_only:
+            self._db = sqlite3.connect(f"file:{index}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._db = sqlite3.connect(index, check_same_thread=False)
+        if not read_only:
+            self._db.executescript(_SCHEMA)
+            self._db.execute("PRAGMA journal_mode=WAL")
+
+        self._domain_dicts: Dict[str, int] = {}
+        self._dicts: Dict[int, "zstandard.ZstdCompressionDict"] = {}
+        self._compressors: Dict[Optional[int], "zstandard.ZstdCompressor"] = {}
+        self._decompressors: Dict[Optional[int], "zstandard.ZstdDecompressor"] = {}
+        if zstandard is not None:
+            for dict_id, domain in self._db.execute(
+                "SELECT dict_id, domain FROM dictionaries ORDER BY created_at"
+            ):
+                self._domain_dicts[domain] = dict_id  # newest wins
+
+    # ------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------
+
+    def _object_path(self, sha: str) -> Path:
+        return self.root / "objects" / sha[:2] / f"{sha}.zst"
+
+    def _dictionary(self, dict_id: int) -> "zstandard.ZstdCompressionDict":
+        zdict = self._dicts.get(dict_id)
+        if zdict is None:
+            data = (self.root / "dicts" / f"{dict_id}.zdict").read_bytes()
+            zdict = zstandard.ZstdCompressionDict(data)
+            self._dicts[dict_id] = zdict
+        return zdict
+
+    def _compress(self, content: bytes, dict_id: Optional[int]) -> bytes:
+        compressor = self._compressors.get(dict_id)
+        if compressor is None:
+            if dict_id is None:
+                compressor = zstandard.ZstdCompressor(level=self.level)
+            else:
+                compressor = zstandard.ZstdCompressor(
+                    level=self.level, dict_data=self._dictionary(dict_id)
+                )
+            self._compressors[dict_id] = compressor
+        return compressor.compress(content)
+
+    def _decompress(self, data: bytes, codec: str, dict_id: Optional[int]) -> bytes:
+        if codec == "zlib":
+            return zlib.decompress(data)
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read this archive")
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            if dict_id is None:
+                decompressor = zstandard.ZstdDecompressor()
+            else:
+                decompressor = zstandard.ZstdDecompressor(dict_data=self._dictionary(dict_id))
+            self._decompressors[dict_id] = decompressor
+        return decompressor.decompress(data)
+
+    # ------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------
+
+    def _has_object(self, sha: str) -> bool:
+        return self._db.execute(
+            "SELECT 1 FROM objects WHERE sha256 = ?", (sha,)
+        ).fetchone() is not None
+
+    def _write_object(self, sha: str, domain: str, content: bytes) -> Tuple[str, Optional[int], int, int]:
+        """Compress a page into its object file; returns (codec, dict_id, size, stored_size)"""
+        if zstandard is not None:
+            codec = "zstd"
+            dict_id = self._domain_dicts.get(domain)
+            data = self._compress(content, dict_id)
+        else:
+            codec, dict_id = "zlib", None
+            data = zlib.compress(content, 6)
+
+        path = self._object_path(sha)
+        path.parent.mkdir(exist_ok=True)
+        # Identical bytes from any process land on the same path
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        return codec, dict_id, len(content), len(data)
+
+    def put(
+        self,
+        url: str,
+        domain: str,
+        content: bytes,
+        encoding: Optional[str] = None,
+        kind: str = "article",
+        fetched_at: Optional[datetime] = None
+    ) -> str:
+        """Store a fetched page; returns its content hash"""
+        sha = hashlib.sha256(content).hexdigest()
+        fetched_at = fetched_at or datetime.utcnow()
+
+        with self._lock:
+            # Compress and write outside the index's write lock, which
+            # other worker processes are waiting on
+            stored = None
+            if not self._has_object(sha):
+                stored = self._write_object(sha, domain, content)
+
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                if stored is None and not self._has_object(sha):
+                    stored = self._write_object(sha, domain, content)  # pruned meanwhile
+                if stored is not None:
+                    # Another process may have stored the same page first
+                    self._db.execute(
+                        "INSERT OR IGNORE INTO objects (sha256, codec, dict_id, size, stored_size) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (sha, *stored)
+                    )
+                self._db.execute(
+                    "INSERT INTO pages (url, domain, kind, fetched_at, sha256, encoding) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, domain, kind, fetched_at.isoformat(), sha, encoding)
+                )
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                raise
+        return sha
+
+    def prune(self, retention_days: int) -> Tuple[int, int]:
+        """
+        Forget pages fetched more than `retention_days` ago and delete
+        objects no remaining page refers to. Returns (pages, objects).
+        """
+        cutoff = (datetime.utcnow() - timedelta(days=retention_days)).isoformat()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                pages = self._db.execute(
+                    "DELETE FROM pages WHERE fetched_at < ?", (cutoff,)
+                ).rowcount
+                orphans = [row[0] for row in self._db.execute(
+                    "SELECT sha256 FROM objects WHERE sha256 NOT IN (SELECT sha256 FROM pages)"
+                )]
+                self._db.executemany(
+                    "DELETE FROM objects WHERE sha256 = ?", [(sha,) for sha in orphans]
+                )
+                # Files go while the write lock is held, so no put() can
+                # re-add one of these objects in between
+                for sha in orphans:
+                    self._object_path(sha).unlink(missing_ok=True)
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                raise
+        return pages, len(orphans)
+
+    def train_dictionary(
+        self,
+        domain: str,
+        max_samples: int = 500,
+        dict_size: int = 112_640
+    ) -> Optional[int]:
+        """
+        Train a zstd dictionary on an outlet's archived pages and use it
+        for that outlet's new objects. Existing objects keep the dictionary
+        they were written with. Returns the dictionary id.
+        """
+        if zstandard is None:
+            return None
+
+        pages = list(self.pages(domain=domain, kind=None, latest_only=False))[-max_samples:]
+        samples = [self.read(page.sha256) for page in pages]
+        if len(samples) < 10:
+            return None
+
+        zdict = zstandard.train_dictionary(dict_size, samples, level=self.level)
+        dict_id = zdict.dict_id()
+        (self.root / "dicts" / f"{dict_id}.zdict").write_bytes(zdict.as_bytes())
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO dictionaries (dict_id, domain, created_at, samples) "
+                "VALUES (?, ?, ?, ?)",
+                (dict_id, domain, datetime.utcnow().isoformat(), len(samples))
+            )
+            self._db.commit()
+            self._dicts[dict_id] = zdict
+            self._domain_dicts[domain] = dict_id
+        return dict_id
+
+    # ------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------
+
+    def read(self, sha: str) -> bytes:
+        """Raw page bytes for a content hash"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT codec, dict_id FROM objects WHERE sha256 = ?", (sha,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(sha)
+        codec, dict_id = row
+        return self._decompress(self._object_path(sha).read_bytes(), codec, dict_id)
+
+    def pages(
+        self,
+        domain: Optional[str] = None,
+        kind: Optional[str] = "article",
+        since: Optional[datetime] = None,
+        latest_only: bool = True
+    ) -> Iterator[ArchivedPage]:
+        """Index entries, oldest first; by default only each URL's latest fetch"""
+        clauses, params = [], []
+        if domain:
+            clauses.append("domain = ?")
+            params.append(domain)
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if since:
+            clauses.append("fetched_at >= ?")
+            params.append(since.isoformat())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        if latest_only:
+            query = (
+                "SELECT url, domain, kind, fetched_at, sha256, encoding FROM pages "
+                f"WHERE id IN (SELECT MAX(id) FROM pages {where} GROUP BY url) ORDER BY id"
+            )
+        else:
+            query = (
+                "SELECT url, domain, kind, fetched_at, sha256, encoding FROM pages "
+                f"{where} ORDER BY id"
+            )
+
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        for url, domain_, kind_, fetched_at, sha, encoding in rows:
+            yield ArchivedPage(
+                url=url,
+                domain=domain_,
+                kind=kind_,
+                fetched_at=datetime.fromisoformat(fetched_at),
+                sha256=sha,
+                encoding=encoding,
+            )
+
+    def domains(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT DISTINCT domain FROM pages ORDER BY domain")]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pages, = self._db.execute("SELECT COUNT(*) FROM pages").fetchone()
+            objects, size, stored = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM objects"
+            ).fetchone()
+        return {"pages": pages, "objects": objects, "bytes": size, "stored_bytes": stored}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
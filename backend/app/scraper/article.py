@@ -0,0 +1,17 @@
+"""
+Scraped article record shared by the harvester and the extractors
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class ScrapedArticle:
+    url: str
+    headline: str
+    body: str
+    author: Optional[str] = None
+    published_at: Optional[datetime] = None
+    outlet_domain: str = ""
+    category_tag: Optional[str] = None
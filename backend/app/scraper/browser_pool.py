@@ -0,0 +1,232 @@
+"""
+Browser Pool
+
+One warm Chromium per process, shared by every ArticleScraper. Pages are
+spread over a small, bounded set of browser contexts, reused across
+outlets and topics, and recycled after a number of uses or on a crash.
+"""
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+from app.config import get_settings
+from app.scraper.proxies import get_proxy_manager
+
+settings = get_settings()
+
+
+@dataclass
+class _ContextSlot:
+    context: BrowserContext
+    open_pages: int = 0
+
+
+@dataclass
+class _PooledPage:
+    page: Page
+    slot: _ContextSlot
+    uses: int = 0
+    crashed: bool = False
+
+
+@dataclass
+class BrowserPoolStats:
+    launches: int = 0
+    pages_created: int = 0
+    pages_recycled: int = 0
+    leases: int = 0
+
+
+class BrowserPool:
+    """Bounded pool of warm Playwright contexts and pages"""
+
+    def __init__(
+        self,
+        use_proxy: bool = True,
+        max_contexts: int = 2,
+        pages_per_context: int = 4,
+        max_page_uses: int = 20,
+        user_agents: Optional[List[str]] = None,
+    ):
+        self.use_proxy = use_proxy
+        self.max_contexts = max_contexts
+        self.pages_per_context = pages_per_context
+        self.max_page_uses = max_page_uses
+        self.user_agents = user_agents or []
+        self.stats = BrowserPoolStats()
+
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._slots: List[_ContextSlot] = []
+        self._idle: List[_PooledPage] = []
+        self._capacity = asyncio.Semaphore(max_contexts * pages_per_context)
+        self._lock = asyncio.Lock()
+
+    def _launch_args(self) -> dict:
+        browser_args = {
+            "headless": True,
+            "args": [
+                "--disable-blink-features=AutomationControlled",
+                "--disable-dev-shm-usage",
+                "--no-sandbox"
+            ]
+        }
+
+        if self.use_proxy:
+            # One sticky session per launch, so a relaunch also rotates the IP
+            proxy = get_proxy_manager().browser_proxy()
+            if proxy:
+                browser_args["proxy"] = proxy
+        return browser_args
+
+    async def _ensure_browser(self) -> Browser:
+        """Launch Chromium once, relaunching if it died"""
+        if self._browser and self._browser.is_connected():
+            return self._browser
+
+        # Anything tied to a dead browser is unusable
+        self._slots.clear()
+        self._idle.clear()
+
+        if not self._playwright:
+            self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(**self._launch_args())
+        self.stats.launches += 1
+        return self._browser
+
+    async def _new_context(self, browser: Browser) -> BrowserContext:
+        user_agent = random.choice(self.user_agents) if self.user_agents else None
+        return await browser.new_context(user_agent=user_agent)
+
+    async def _checkout(self) -> _PooledPage:
+        async with self._lock:
+            browser = await self._ensure_browser()
+
+            while self._idle:
+                pooled = self._idle.pop()
+                if not pooled.page.is_closed():
+                    return pooled
+                pooled.slot.open_pages -= 1
+
+            if len(self._slots) < self.max_contexts:
+                slot = _ContextSlot(await self._new_context(browser))
+                self._slots.append(slot)
+            else:
+                slot = min(self._slots, key=lambda s: s.open_pages)
+
+            try:
+                page = await slot.context.new_page()
+            except Exception:
+                # Context died (e.g. renderer crash); replace it
+                self._slots.remove(slot)
+                slot = _ContextSlot(await self._new_context(browser))
+                self._slots.append(slot)
+                page = await slot.context.new_page()
+            slot.open_pages += 1
+            self.stats.pages_created += 1
+
+            pooled = _PooledPage(page, slot)
+            page.on("crash", lambda _: setattr(pooled, "crashed", True))
+            return pooled
+
+    async def _release(self, pooled: _PooledPage, failed: bool) -> None:
+        pooled.uses += 1
+        recycle = (
+            failed
+            or pooled.crashed
+            or pooled.page.is_closed()
+            or pooled.uses >= self.max_page_uses
+        )
+
+        if not recycle:
+            self._idle.append(pooled)
+            return
+
+        self.stats.pages_recycled += 1
+        pooled.slot.open_pages -= 1
+        try:
+            await pooled.page.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        Lease a warm page.
+
+        A page whose lease raised is recycled rather than reused, since it
+        may be stuck mid-navigation.
+        """
+        async with self._capacity:
+            pooled = await self._checkout()
+            self.stats.leases += 1
+            failed = False
+            try:
+                yield pooled.page
+            except Exception:
+                failed = True
+                raise
+            finally:
+                await self._release(pooled, failed)
+
+    async def close(self) -> None:
+        """Shut down all contexts, the browser and Playwright"""
+        async with self._lock:
+            for slot in self._slots:
+                try:
+                    await slot.context.close()
+                except Exception:
+                    pass
+            self._slots.clear()
+            self._idle.clear()
+
+            if self._browser:
+                try:
+                    await self._browser.close()
+                except Exception:
+                    pass
+                self._browser = None
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+# Process-wide pools, one per proxy mode. Playwright objects belong to the
+# event loop that created them, so pools are rebuilt when the loop changes
+# (each Celery task runs its own asyncio.run).
+_pools: Dict[bool, BrowserPool] = {}
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_browser_pool(use_proxy: bool = True, user_agents: Optional[List[str]] = None) -> BrowserPool:
+    """Get the process-wide browser pool for the running event loop"""
+    global _pool_loop
+
+    loop = asyncio.get_running_loop()
+    if loop is not _pool_loop:
+        _pools.clear()
+        _pool_loop = loop
+
+    pool = _pools.get(use_proxy)
+    if pool is None:
+        pool = BrowserPool(
+            use_proxy=use_proxy,
+            max_contexts=settings.browser_max_contexts,
+            pages_per_context=settings.browser_pages_per_context,
+            max_page_uses=settings.browser_max_page_uses,
+            user_agents=user_agents,
+        )
+        _pools[use_proxy] = pool
+    return pool
+
+
+async def close_browser_pools() -> None:
+    """Close every browser pool owned by the running event loop"""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
@@ -0,0 +1,166 @@
+"""
+Taxonomy Classifier
+
+Assigns scraped articles to a TOPIC_CATEGORIES category by keyword hits.
+
+The taxonomy is compiled once into an Aho-Corasick automaton over word
+tokens, so one pass over the text finds every keyword and bias indicator
+of every category, and only whole words match ("bill" no longer hits
+"billion", nor "house" "household"). Simple plurals of each phrase are
+matched too, since substring matching used to catch them for free.
+"""
+import re
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.scraper.taxonomy import TOPIC_CATEGORIES
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# (category, kind, phrase) where kind is "keyword" or "bias"
+Hit = Tuple[str, str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; punctuation and hyphens split words"""
+    return _TOKEN.findall(text.lower())
+
+
+def _plural(word: str) -> str:
+    if word.endswith(("s", "x", "ch", "sh")):
+        return word + "es"
+    if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
+        return word[:-1] + "ies"
+    return word + "s"
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton whose alphabet is word tokens"""
+
+    def __init__(self, phrases: Iterable[Tuple[List[str], Hit]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Hit]] = [[]]
+
+        for tokens, hit in phrases:
+            self._add(tokens, hit)
+        self._build_failure_links()
+
+    def _add(self, tokens: List[str], hit: Hit) -> None:
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        if hit not in self._out[state]:
+            self._out[state].append(hit)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(token, 0)
+                if self._fail[nxt] == nxt:
+                    self._fail[nxt] = 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, tokens: Iterable[str]) -> Iterator[Hit]:
+        """Yield every phrase hit in a single pass over the tokens"""
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        state = 0
+        for token in tokens:
+            if state == 0:
+                # Fast path: most words start nothing
+                state = root.get(token, 0)
+            else:
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+            if state:
+                yield from out[state]
+
+
+@dataclass
+class ClassificationResult:
+    category: Optional[str]
+    # category -> phrase -> number of occurrences
+    keyword_hits: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    bias_hits: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def keyword_counts(self) -> Dict[str, int]:
+        """Total keyword occurrences per category"""
+        return {c: sum(hits.values()) for c, hits in self.keyword_hits.items()}
+
+    @property
+    def bias_indicators(self) -> List[str]:
+        """Distinct bias indicator phrases found, across categories"""
+        return sorted({phrase for hits in self.bias_hits.values() for phrase in hits})
+
+
+class TaxonomyClassifier:
+    """TOPIC_CATEGORIES compiled into a single keyword automaton"""
+
+    def __init__(self, categories: Dict[str, dict] = TOPIC_CATEGORIES, min_matches: int = 2):
+        self.categories = list(categories)
+        self.min_matches = min_matches
+
+        phrases = []
+        for category, config in categories.items():
+            for kind, key in (("keyword", "keywords"), ("bias", "bias_indicators")):
+                for phrase in config.get(key, []):
+                    tokens = tokenize(phrase)
+                    if not tokens:
+                        continue
+                    hit = (category, kind, phrase)
+                    phrases.append((tokens, hit))
+                    phrases.append((tokens[:-1] + [_plural(tokens[-1])], hit))
+        self.automaton = KeywordAutomaton(phrases)
+
+    def classify(self, headline: str, body: str = "") -> ClassificationResult:
+        keyword_hits: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        bias_hits: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+        for category, kind, phrase in self.automaton.find(tokenize(f"{headline} {body}")):
+            target = keyword_hits if kind == "keyword" else bias_hits
+            target[category][phrase] += 1
+
+        # Rank by distinct keywords matched, as before; ties go to the
+        # earlier (higher priority) category
+        best_category = None
+        max_matches = 0
+        for category in self.categories:
+            matches = len(keyword_hits.get(category, ()))
+            if matches > max_matches:
+                max_matches = matches
+                best_category = category
+
+        return ClassificationResult(
+            category=best_category if max_matches >= self.min_matches else None,
+            keyword_hits={c: dict(h) for c, h in keyword_hits.items()},
+            bias_hits={c: dict(h) for c, h in bias_hits.items()},
+        )
+
+
+@lru_cache()
+def get_classifier() -> TaxonomyClassifier:
+    """Process-wide classifier, compiled on first use"""
+    return TaxonomyClassifier()
+
+
+def classify_article(headline: str, body: str) -> Optional[str]:
+    """Classify article into taxonomy category based on keywords"""
+    return get_classifier().classify(headline, body).category
@@ -0,0 +1,174 @@
+"""
+Date parsing for scraped articles
+
+Most published dates are ISO-8601 (datetime attributes, JSON-LD) or
+RFC-2822 (feeds), and each outlet prints the rest in one or two fixed
+formats. So we try the stdlib fast paths first, then the last format that
+worked for the outlet, then a short list of known formats, and only fall
+back to dateutil on a miss. Relative strings ("2 hours ago") are resolved
+against fetch time.
+
+Results are naive UTC, matching the rest of the schema (datetime.utcnow).
+"""
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from dateutil import parser
+
+try:
+    from zoneinfo import ZoneInfo
+    _EASTERN = ZoneInfo("America/New_York")
+    _CENTRAL = ZoneInfo("America/Chicago")
+    _MOUNTAIN = ZoneInfo("America/Denver")
+    _PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # No tz database installed; fall back to standard time
+    _EASTERN = timezone(timedelta(hours=-5))
+    _CENTRAL = timezone(timedelta(hours=-6))
+    _MOUNTAIN = timezone(timedelta(hours=-7))
+    _PACIFIC = timezone(timedelta(hours=-8))
+
+
+_TZ_ABBREVIATIONS: Dict[str, tzinfo] = {
+    "UTC": timezone.utc, "GMT": timezone.utc, "Z": timezone.utc,
+    "ET": _EASTERN, "EST": timezone(timedelta(hours=-5)), "EDT": timezone(timedelta(hours=-4)),
+    "CT": _CENTRAL, "CST": timezone(timedelta(hours=-6)), "CDT": timezone(timedelta(hours=-5)),
+    "MT": _MOUNTAIN, "MST": timezone(timedelta(hours=-7)), "MDT": timezone(timedelta(hours=-6)),
+    "PT": _PACIFIC, "PST": timezone(timedelta(hours=-8)), "PDT": timezone(timedelta(hours=-7)),
+}
+
+# Formats seen on outlet pages, tried after the ISO/RFC fast paths
+KNOWN_FORMATS = [
+    "%B %d, %Y",
+    "%B %d, %Y %I:%M %p",
+    "%B %d, %Y %I:%M%p",
+    "%B %d, %Y, %I:%M %p",
+    "%b %d, %Y",
+    "%b %d, %Y %I:%M %p",
+    "%b %d, %Y, %I:%M %p",
+    "%I:%M %p, %a %B %d, %Y",
+    "%I:%M %p, %B %d, %Y",
+    "%a %B %d, %Y",
+    "%A, %B %d, %Y",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y/%m/%d",
+    "%d %B %Y",
+]
+
+_PREFIX = re.compile(r"^(?:last\s+)?(?:published|updated|posted|modified)(?:\s+on)?[:\s]+", re.I)
+_TZ_SUFFIX = re.compile(r"\s*\b(UTC|GMT|[ECMP][SD]?T)\b\.?")
+_MERIDIEM = re.compile(r"\b([ap])\.?\s?m\.?(?=\W|$)", re.I)
+_RELATIVE = re.compile(
+    r"^(?P<n>\d+|an?|one)\s+(?P<unit>sec(?:ond)?|min(?:ute)?|hour|hr|day|week)s?\s+ago$",
+    re.I
+)
+_RELATIVE_UNITS = {
+    "sec": "seconds", "second": "seconds",
+    "min": "minutes", "minute": "minutes",
+    "hour": "hours", "hr": "hours",
+    "day": "days", "week": "weeks",
+}
+
+
+def _to_naive_utc(dt: datetime, tz: Optional[tzinfo] = None) -> datetime:
+    if dt.tzinfo is None and tz is not None:
+        dt = dt.replace(tzinfo=tz)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _parse_relative(text: str, fetched_at: datetime) -> Optional[datetime]:
+    lowered = text.lower()
+    if lowered in ("just now", "now"):
+        return fetched_at
+    if lowered == "yesterday":
+        return fetched_at - timedelta(days=1)
+
+    match = _RELATIVE.match(lowered)
+    if not match:
+        return None
+    n = match.group("n")
+    amount = 1 if not n.isdigit() else int(n)
+    return fetched_at - timedelta(**{_RELATIVE_UNITS[match.group("unit")]: amount})
+
+
+class DateNormalizer:
+    """Date parser that learns each outlet's format"""
+
+    def __init__(self, formats: Optional[list] = None):
+        self.formats = formats or KNOWN_FORMATS
+        self._domain_formats: Dict[str, str] = {}
+        self.fallbacks = 0  # misses that went to dateutil
+
+    def parse(
+        self,
+        date_str: Optional[str],
+        domain: Optional[str] = None,
+        fetched_at: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        if not date_str:
+            return None
+        text = date_str.strip()
+        if not text:
+            return None
+
+        # ISO-8601 fast path (datetime attributes, JSON-LD)
+        if text[:4].isdigit():
+            try:
+                return _to_naive_utc(datetime.fromisoformat(text))
+            except ValueError:
+                pass
+
+        # RFC-2822 fast path (feeds, some meta tags)
+        if text[:3].isalpha() and "," in text[:5]:
+            try:
+                return _to_naive_utc(parsedate_to_datetime(text), timezone.utc)
+            except (TypeError, ValueError):
+                pass
+
+        cleaned = _PREFIX.sub("", text)
+        relative = _parse_relative(cleaned, fetched_at or datetime.utcnow())
+        if relative:
+            return relative
+
+        tz = None
+        tz_match = _TZ_SUFFIX.search(cleaned)
+        if tz_match:
+            tz = _TZ_ABBREVIATIONS.get(tz_match.group(1).upper())
+            cleaned = (cleaned[:tz_match.start()] + cleaned[tz_match.end():]).strip(" ,")
+        cleaned = _MERIDIEM.sub(lambda m: m.group(1).upper() + "M", cleaned).replace(".", "")
+        cleaned = " ".join(cleaned.split())
+
+        # Last format that worked for this outlet, then the known list
+        learned = self._domain_formats.get(domain) if domain else None
+        for fmt in ([learned] if learned else []) + self.formats:
+            try:
+                parsed = datetime.strptime(cleaned, fmt)
+            except ValueError:
+                continue
+            if domain:
+                self._domain_formats[domain] = fmt
+            return _to_naive_utc(parsed, tz)
+
+        self.fallbacks += 1
+        try:
+            return _to_naive_utc(parser.parse(cleaned), tz)
+        except (ValueError, OverflowError):
+            return None
+
+
+_normalizer = DateNormalizer()
+
+
+def parse_date(
+    date_str: Optional[str],
+    domain: Optional[str] = None,
+    fetched_at: Optional[datetime] = None
+) -> Optional[datetime]:
+    """Parse various date formats"""
+    return _normalizer.parse(date_str, domain, fetched_at)
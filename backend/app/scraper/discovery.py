@@ -8,26 +8,26 @@ Scans AP and Reuters wire services daily to identify:
 Uses NLP to extract and cluster keywords into topics.
 """
 import asyncio
+import hashlib
+import multiprocessing
+import time
 from datetime import datetime, date
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
 from dataclasses import dataclass
 import re
 
 import httpx
-from bs4 import BeautifulSoup
-import spacy
 
 from app.config import get_settings
+from app.scraper.feed_cache import FeedCache
+from app.scraper.feeds import FeedItem, FeedStreamParser, parse_feed_bytes
+from app.scraper.nlp import get_nlp, model_id
 
 settings = get_settings()
 
-# Load spaCy model for NER
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    # Model not installed - will need to run: python -m spacy download en_core_web_sm
-    nlp = None
+# Entity types worth turning into topics
+NER_LABELS = {"PERSON", "ORG", "GPE", "EVENT", "LAW", "NORP"}
 
 
 @dataclass
@@ -64,48 +64,212 @@ REUTERS_FEEDS = {
 }
 
 
-async def fetch_feed(url: str) -> List[Dict[str, str]]:
-    """Fetch and parse an RSS feed"""
-    async with httpx.AsyncClient(timeout=30) as client:
-        try:
-            response = await client.get(url)
+@dataclass
+class FeedResult:
+    url: str
+    category: str
+    items: List[Dict[str, str]]
+    elapsed: float
+    partial: bool = False  # deadline hit mid-download; items are what arrived
+    not_modified: bool = False  # 304; items are from the feed cache
+    error: Optional[str] = None
+
+
+def _feed_item(item: FeedItem) -> Dict[str, str]:
+    content_hash = hashlib.sha1(f"{item.title}\n{item.description}".encode()).hexdigest()
+    return {
+        "title": item.title,
+        "description": item.description,
+        "link": item.link,
+        # Identity across runs: GUID, else link, else the content itself
+        "key": item.guid or item.link or content_hash,
+        "hash": content_hash,
+    }
+
+
+def parse_feed(content: bytes) -> List[Dict[str, str]]:
+    """Feed items with title, description, link, key and content hash (RSS or Atom)"""
+    return [_feed_item(item) for item in parse_feed_bytes(content)]
+
+
+def _feed_client() -> httpx.AsyncClient:
+    """One keep-alive client for all of a discovery run's feeds"""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(settings.discovery_feed_timeout_seconds, connect=5.0),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        follow_redirects=True,
+    )
+
+
+async def fetch_feed_result(
+    url: str,
+    client: httpx.AsyncClient,
+    category: str = "",
+    deadline: Optional[float] = None,
+    cache: Optional[FeedCache] = None
+) -> FeedResult:
+    """
+    Fetch one feed within `deadline` seconds, parsing items as the body
+    streams in. A feed still downloading at the deadline keeps the items
+    that had fully arrived. With a cache, the fetch is conditional and a
+    304 reuses the cached items.
+    """
+    deadline = deadline or settings.discovery_feed_timeout_seconds
+    started = time.perf_counter()
+    parser = FeedStreamParser()
+    parsed: List[FeedItem] = []
+    received = 0
+    validators = {}
+    
+    async def download():
+        nonlocal received
+        headers = cache.validators(url) if cache else {}
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and headers:
+                validators["not_modified"] = True
+                return
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "xml")
-            items = []
-            
-            for item in soup.find_all("item"):
-                title = item.find("title")
-                description = item.find("description")
-                
-                items.append({
-                    "title": title.get_text(strip=True) if title else "",
-                    "description": description.get_text(strip=True) if description else ""
-                })
-            
-            return items
-            
-        except Exception as e:
-            print(f"Error fetching feed {url}: {e}")
-            return []
+            validators["etag"] = response.headers.get("ETag")
+            validators["last_modified"] = response.headers.get("Last-Modified")
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                parsed.extend(parser.feed(chunk))
+            parsed.extend(parser.close())
+    
+    partial = False
+    error = None
+    try:
+        await asyncio.wait_for(download(), timeout=deadline)
+    except asyncio.TimeoutError:
+        partial = received > 0
+        error = None if partial else f"no response within {deadline:.0f}s"
+    except httpx.HTTPStatusError as e:
+        error = f"HTTP {e.response.status_code}"
+    except Exception as e:
+        error = str(e) or type(e).__name__
+    
+    not_modified = validators.get("not_modified", False)
+    if not_modified:
+        items = cache.feed_items(url)
+    else:
+        items = [_feed_item(item) for item in parsed] if partial or error is None else []
+        if cache and items and not partial and error is None:
+            cache.put_feed(url, items, validators.get("etag"), validators.get("last_modified"))
+    return FeedResult(
+        url=url,
+        category=category,
+        items=items,
+        elapsed=time.perf_counter() - started,
+        partial=partial,
+        not_modified=not_modified,
+        error=error,
+    )
 
 
-def extract_entities(text: str) -> List[str]:
-    """Extract named entities from text using spaCy"""
+async def fetch_feed(url: str, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, str]]:
+    """Fetch and parse an RSS feed"""
+    if client is not None:
+        result = await fetch_feed_result(url, client)
+    else:
+        async with _feed_client() as own_client:
+            result = await fetch_feed_result(url, own_client)
+    if result.error:
+        print(f"Error fetching feed {url}: {result.error}")
+    return result.items
+
+
+async def fetch_feeds(
+    feeds: Dict[str, List[str]],
+    cache: Optional[FeedCache] = None
+) -> List[FeedResult]:
+    """
+    Fetch every feed ({category: [urls]}) concurrently over one client.
+    Total time is the slowest feed, capped by the per-feed deadline.
+    """
+    started = time.perf_counter()
+    async with _feed_client() as client:
+        results = await asyncio.gather(*(
+            fetch_feed_result(url, client, category, cache=cache)
+            for category, urls in feeds.items()
+            for url in urls
+        ))
+    
+    print(f"Fetched {len(results)} feeds in {time.perf_counter() - started:.2f}s:")
+    for result in results:
+        status = result.error or (
+            "partial" if result.partial else "cached" if result.not_modified else "ok"
+        )
+        print(f"  {result.elapsed:6.2f}s {len(result.items):>4} items  {status:<10} {result.url}")
+    return results
+
+
+def extract_entities_batch(
+    texts: List[str],
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None
+) -> List[List[str]]:
+    """
+    Extract named entities from many texts with one nlp.pipe pass.
+    Returns one entity list per text, in order. Runs in-process inside a
+    daemonic process (a Celery prefork child), which cannot fork workers.
+    """
+    nlp = get_nlp()
     if not nlp:
         # Fallback: simple keyword extraction
-        words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
-        return list(set(words))
+        return [
+            list(set(re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)))
+            for text in texts
+        ]
+    
+    n_process = n_process or settings.discovery_nlp_n_process
+    if n_process != 1 and multiprocessing.current_process().daemon:
+        n_process = 1
+    docs = nlp.pipe(
+        texts,
+        batch_size=batch_size or settings.discovery_nlp_batch_size,
+        n_process=n_process,
+    )
+    # Keep relevant entity types
+    return [
+        [ent.text for ent in doc.ents if ent.label_ in NER_LABELS]
+        for doc in docs
+    ]
+
+
+def extract_entities(text: str) -> List[str]:
+    """Extract named entities from text using spaCy"""
+    return extract_entities_batch([text], n_process=1)[0]
+
+
+def _item_text(item: Dict[str, str]) -> str:
+    return f"{item['title']} {item['description']}"
+
+
+def extract_item_entities(
+    items: List[Dict[str, str]],
+    cache: Optional[FeedCache] = None
+) -> List[List[str]]:
+    """
+    Entities for each feed item, in order. Items already seen with the
+    same content come from the cache; the rest (deduplicated by key) go
+    through one batched NER pass and are cached.
+    """
+    if cache is None:
+        return extract_entities_batch([_item_text(item) for item in items])
     
-    doc = nlp(text)
+    model = model_id()
+    known = cache.entities(((item["key"], item["hash"]) for item in items), model)
+    new = {item["key"]: item for item in items if item["key"] not in known}
     
-    entities = []
-    for ent in doc.ents:
-        # Keep relevant entity types
-        if ent.label_ in ["PERSON", "ORG", "GPE", "EVENT", "LAW", "NORP"]:
-            entities.append(ent.text)
+    if new:
+        extracted = extract_entities_batch([_item_text(item) for item in new.values()])
+        cache.put_entities(
+            ((key, item["hash"], entities) for (key, item), entities in zip(new.items(), extracted)),
+            model
+        )
+        known.update(zip(new, extracted))
     
-    return entities
+    return [known[item["key"]] for item in items]
 
 
 def cluster_into_topics(
@@ -144,21 +308,29 @@ async def discover_daily_topics() -> Tuple[List[DiscoveredTopic], List[Discovere
     us_entities = []
     intl_entities = []
     
-    # Fetch US feeds
-    for url in AP_FEEDS["us"] + REUTERS_FEEDS["us"]:
-        items = await fetch_feed(url)
-        for item in items:
-            text = f"{item['title']} {item['description']}"
-            entities = extract_entities(text)
-            us_entities.extend(entities)
-    
-    # Fetch International feeds
-    for url in AP_FEEDS["intl"] + REUTERS_FEEDS["intl"]:
-        items = await fetch_feed(url)
-        for item in items:
-            text = f"{item['title']} {item['description']}"
-            entities = extract_entities(text)
-            intl_entities.extend(entities)
+    cache = FeedCache(settings.discovery_cache_path) if settings.discovery_cache_enabled else None
+    try:
+        # Fetch all wire feeds at once; failed feeds just contribute nothing
+        results = await fetch_feeds({
+            "us": AP_FEEDS["us"] + REUTERS_FEEDS["us"],
+            "intl": AP_FEEDS["intl"] + REUTERS_FEEDS["intl"],
+        }, cache)
+        
+        # Only items not seen before go through NER (in one batched pass)
+        items, categories = [], []
+        for result in results:
+            items.extend(result.items)
+            categories.extend([result.category] * len(result.items))
+        
+        for category, entities in zip(categories, extract_item_entities(items, cache)):
+            (us_entities if category == "us" else intl_entities).extend(entities)
+        
+        if cache:
+            cache.prune()
+            cache.print_summary()
+    finally:
+        if cache:
+            cache.close()
     
     # MANUAL FALLBACK (If feeds fail)
     if not us_entities:
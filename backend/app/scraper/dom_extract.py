@@ -0,0 +1,60 @@
+"""
+Single Round-Trip DOM Extraction
+
+Runs one page.evaluate per page using the OutletConfig selectors, instead
+of a CDP call per element, attribute and paragraph.
+"""
+from typing import Any, Dict, List
+from urllib.parse import urljoin
+
+from playwright.async_api import Page
+
+from app.scraper.outlets import OutletConfig
+
+
+_EXTRACT_ARTICLE_JS = """
+(sel) => {
+    const text = (el) => (el ? (el.innerText || el.textContent || "").trim() : "");
+    const first = (selector) => (selector ? document.querySelector(selector) : null);
+
+    const dateEl = first(sel.date);
+    const authorEl = first(sel.author);
+
+    return {
+        headline: text(first(sel.headline)),
+        body: Array.from(document.querySelectorAll(sel.body)).map(text).filter(Boolean),
+        author: authorEl ? text(authorEl) : null,
+        date: dateEl ? (dateEl.getAttribute("datetime") || text(dateEl)) : null,
+    };
+}
+"""
+
+_EXTRACT_LINKS_JS = """
+(args) => Array.from(document.querySelectorAll(args.selector))
+    .slice(0, args.limit)
+    .map((a) => a.getAttribute("href"))
+    .filter(Boolean)
+"""
+
+
+async def extract_article_fields(page: Page, config: OutletConfig) -> Dict[str, Any]:
+    """
+    Pull headline, body paragraphs, author and raw date string in one call.
+
+    Returns {"headline": str, "body": [str], "author": str|None, "date": str|None}.
+    """
+    return await page.evaluate(_EXTRACT_ARTICLE_JS, {
+        "headline": config.headline_selector,
+        "body": config.body_selector,
+        "author": config.author_selector,
+        "date": config.date_selector,
+    })
+
+
+async def extract_links(page: Page, config: OutletConfig, max_articles: int) -> List[str]:
+    """Collect absolute article URLs from a search page in one call"""
+    hrefs = await page.evaluate(_EXTRACT_LINKS_JS, {
+        "selector": config.article_selector,
+        "limit": max_articles,
+    })
+    return [urljoin(f"https://{config.domain}", href) for href in hrefs]
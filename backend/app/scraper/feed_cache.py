@@ -0,0 +1,152 @@
+"""
+Discovery Feed Cache
+
+Wire feeds change by a handful of items an hour, but discovery used to
+re-download every feed and re-run NER on every item each time. A local
+SQLite store keeps:
+
+- per feed: ETag / Last-Modified and the last parsed items, so an
+  unchanged feed is a 304 and nothing is parsed;
+- per item (keyed by GUID, else link): a content hash and the entities
+  extracted from it, so only new or edited items go through spaCy.
+
+Entities are tagged with the model that produced them; switching models
+simply misses the cache.
+"""
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feeds (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    items TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    entities TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_items_last_seen ON items(last_seen);
+"""
+
+
+class FeedCache:
+    """Conditional-GET validators and per-item entity results for discovery"""
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    # ------------------------------------------------------------
+    # Feeds
+    # ------------------------------------------------------------
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a feed we have items for"""
+        row = self._db.execute(
+            "SELECT etag, last_modified FROM feeds WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return {}
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def feed_items(self, url: str) -> List[Dict[str, str]]:
+        """Items from the last full fetch of a feed (for a 304)"""
+        self.not_modified += 1
+        row = self._db.execute("SELECT items FROM feeds WHERE url = ?", (url,)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def put_feed(
+        self,
+        url: str,
+        items: List[Dict[str, str]],
+        etag: Optional[str],
+        last_modified: Optional[str]
+    ) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO feeds (url, etag, last_modified, items, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (url, etag, last_modified, json.dumps(items), datetime.utcnow().isoformat())
+        )
+        self._db.commit()
+
+    # ------------------------------------------------------------
+    # Items
+    # ------------------------------------------------------------
+
+    def entities(
+        self,
+        items: Iterable[Tuple[str, str]],
+        model: str
+    ) -> Dict[str, List[str]]:
+        """Cached entities for (key, content hash) pairs that are unchanged"""
+        pairs = dict(items)
+        cached = {}
+        keys = list(pairs)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self._db.execute(
+                f"SELECT key, content_hash, model, entities FROM items "
+                f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            for key, content_hash, item_model, entities in rows:
+                if content_hash == pairs[key] and item_model == model:
+                    cached[key] = json.loads(entities)
+
+        self.hits += len(cached)
+        self.misses += len(pairs) - len(cached)
+        now = datetime.utcnow().isoformat()
+        self._db.executemany(
+            "UPDATE items SET last_seen = ? WHERE key = ?", [(now, key) for key in cached]
+        )
+        self._db.commit()
+        return cached
+
+    def put_entities(
+        self,
+        results: Iterable[Tuple[str, str, List[str]]],
+        model: str
+    ) -> None:
+        """Store (key, content hash, entities) for newly extracted items"""
+        now = datetime.utcnow().isoformat()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO items (key, content_hash, model, entities, last_seen) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(key, content_hash, model, json.dumps(entities), now) for key, content_hash, entities in results]
+        )
+        self._db.commit()
+
+    def prune(self, days: int = 7) -> int:
+        """Forget items no feed has carried for `days`"""
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        deleted = self._db.execute("DELETE FROM items WHERE last_seen < ?", (cutoff,)).rowcount
+        self._db.commit()
+        return deleted
+
+    def print_summary(self) -> None:
+        print(
+            f"Feed cache: {self.not_modified} feeds not modified, "
+            f"{self.hits} items cached, {self.misses} extracted"
+        )
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,149 @@
+"""
+Streaming Feed Parser
+
+RSS 2.0, RSS 1.0 (RDF) and Atom feeds parsed incrementally with an lxml
+pull parser as the response streams in. Each <item>/<entry> becomes a
+small FeedItem as soon as its end tag arrives and is then cleared from
+the tree, so memory stays flat however large the feed. Descriptions are
+reduced to plain text with a tag-stripping pass instead of a second
+HTML parse.
+"""
+import html
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List
+
+from lxml import etree
+
+from app.scraper.markup import localname, release, strip_tags
+
+_ITEM_TAGS = {"item", "entry"}
+_SCRIPT_STYLE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.I | re.S)
+
+# Child element -> FeedItem field, first match wins (RSS and Atom names)
+_FIELDS = {
+    "title": "title",
+    "guid": "guid",
+    "id": "guid",
+    "description": "description",
+    "summary": "description",
+    "encoded": "content",  # content:encoded
+    "content": "content",
+    "pubDate": "published",
+    "published": "published",
+    "date": "published",  # dc:date
+    "updated": "updated",
+}
+
+
+@dataclass
+class FeedItem:
+    title: str
+    link: str = ""
+    guid: str = ""
+    description: str = ""  # plain text
+    published: str = ""  # raw date string, as the feed wrote it
+
+
+def strip_html(text: str) -> str:
+    """Plain text from a description that may carry (escaped) HTML"""
+    if "<" in text:
+        text = strip_tags(_SCRIPT_STYLE.sub(" ", text))
+    return " ".join(html.unescape(text).split())
+
+
+def _atom_link(links: List[etree._Element]) -> str:
+    """rel="alternate" (or no rel) is the article; others are enclosures, replies, ..."""
+    for link in links:
+        if link.get("rel", "alternate") == "alternate" and link.get("href"):
+            return link.get("href").strip()
+    return links[0].get("href", "").strip() if links else ""
+
+
+def _item(el: etree._Element) -> FeedItem:
+    fields: Dict[str, str] = {}
+    atom_links = []
+    for child in el:
+        if not isinstance(child.tag, str):
+            continue
+        name = localname(child)
+        if name == "link":
+            if child.get("href") is not None:
+                atom_links.append(child)
+            else:
+                fields.setdefault("link", (child.text or "").strip())
+            continue
+        field = _FIELDS.get(name)
+        if field is None or fields.get(field):
+            continue
+        # Atom text constructs may be XHTML children rather than text
+        text = child.text or ""
+        if len(child):
+            text = etree.tostring(child, method="text", encoding="unicode", with_tail=False)
+        fields[field] = text.strip()  # empty (e.g. media:content) can be replaced
+
+    link = fields.get("link") or _atom_link(atom_links)
+    guid = fields.get("guid", "")
+    # RSS guids with isPermaLink (the default) are the article URL
+    if not link and guid.startswith("http"):
+        link = guid
+    return FeedItem(
+        title=strip_html(fields.get("title", "")),
+        link=link,
+        guid=guid,
+        description=strip_html(fields.get("description") or fields.get("content", "")),
+        published=fields.get("published") or fields.get("updated", ""),
+    )
+
+
+class FeedStreamParser:
+    """
+    Incremental RSS/Atom parser. Feed it response chunks; each call
+    returns the items completed so far.
+    """
+
+    def __init__(self):
+        self._parser = etree.XMLPullParser(
+            events=("end",),
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+        self.items_seen = 0
+
+    def feed(self, chunk: bytes) -> List[FeedItem]:
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[FeedItem]:
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError:
+            pass
+        return self._drain()
+
+    def _drain(self) -> List[FeedItem]:
+        items = []
+        for _, el in self._parser.read_events():
+            if not isinstance(el.tag, str) or localname(el) not in _ITEM_TAGS:
+                continue
+            items.append(_item(el))
+            self.items_seen += 1
+
+            release(el)
+        return items
+
+
+def iter_feed(chunks: Iterable[bytes]) -> Iterator[FeedItem]:
+    """Items from a feed body delivered in chunks"""
+    parser = FeedStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def parse_feed_bytes(content: bytes, chunk_size: int = 65536) -> List[FeedItem]:
+    """Items from a complete feed body"""
+    return list(iter_feed(
+        content[start:start + chunk_size] for start in range(0, len(content), chunk_size)
+    ))
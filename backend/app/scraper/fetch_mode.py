@@ -0,0 +1,109 @@
+"""
+Adaptive Fetch Mode
+
+needs_javascript used to decide up front that an outlet always gets a
+browser render. Instead, every fetch starts in the cheapest mode that has
+been working: plain HTTP first, escalating to Playwright only when the
+HTTP result fails extraction. A rolling success rate per (domain, page
+type) lets outlets whose server HTML never works start in the browser,
+with an occasional HTTP probe in case that changes.
+"""
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+HTTP = "http"
+BROWSER = "browser"
+
+Key = Tuple[str, str]  # (domain, page type: "search" or "article")
+
+
+@dataclass
+class FetchModeStats:
+    http_ok: int = 0
+    http_failed: int = 0
+    escalations: int = 0
+    browser_starts: int = 0
+    browser_ok: int = 0
+    browser_failed: int = 0
+
+
+class FetchModeSelector:
+    """Rolling HTTP success rates that pick where each fetch starts"""
+
+    def __init__(
+        self,
+        window: int = 20,
+        min_samples: int = 5,
+        min_success_rate: float = 0.5,
+        probe_every: int = 10
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.min_success_rate = min_success_rate
+        self.probe_every = probe_every
+        self._http: Dict[Key, Deque[bool]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._browser_picks: Dict[Key, int] = defaultdict(int)
+        self.stats: Dict[str, FetchModeStats] = defaultdict(FetchModeStats)
+
+    def http_success_rate(self, domain: str, page_type: str) -> float:
+        results = self._http[(domain, page_type)]
+        return sum(results) / len(results) if results else 1.0
+
+    def start_mode(self, domain: str, page_type: str) -> str:
+        key = (domain, page_type)
+        results = self._http[key]
+        if len(results) < self.min_samples:
+            return HTTP
+        if self.http_success_rate(domain, page_type) >= self.min_success_rate:
+            return HTTP
+
+        self._browser_picks[key] += 1
+        if self._browser_picks[key] % self.probe_every == 0:
+            return HTTP  # probe: the server HTML may have started working
+        self.stats[domain].browser_starts += 1
+        return BROWSER
+
+    def record(self, domain: str, page_type: str, mode: str, success: bool) -> None:
+        stats = self.stats[domain]
+        if mode == HTTP:
+            self._http[(domain, page_type)].append(success)
+            if success:
+                stats.http_ok += 1
+            else:
+                stats.http_failed += 1
+        elif success:
+            stats.browser_ok += 1
+        else:
+            stats.browser_failed += 1
+
+    def record_escalation(self, domain: str) -> None:
+        self.stats[domain].escalations += 1
+
+    def reset_stats(self) -> None:
+        """Start a new run's counters; learned success rates are kept"""
+        self.stats.clear()
+
+    def summary(self) -> Dict[str, FetchModeStats]:
+        return dict(self.stats)
+
+    def print_summary(self) -> None:
+        if not self.stats:
+            return
+        print("Fetch modes (http ok/failed, escalated, browser-first, browser ok/failed):")
+        for domain, s in sorted(self.stats.items()):
+            print(
+                f"  {domain}: {s.http_ok}/{s.http_failed}, {s.escalations}, "
+                f"{s.browser_starts}, {s.browser_ok}/{s.browser_failed}"
+            )
+
+
+_selector: Optional[FetchModeSelector] = None
+
+
+def get_fetch_mode_selector(**kwargs) -> FetchModeSelector:
+    """Process-wide selector, so what was learned carries over between runs"""
+    global _selector
+    if _selector is None:
+        _selector = FetchModeSelector(**kwargs)
+    return _selector
@@ -0,0 +1,297 @@
+"""
+Crawl Frontier
+
+Redis-backed work queue for a harvest run, so any number of Celery
+workers can crawl it together instead of one task doing the whole run.
+
+Per run (keys under frontier:<run_id>):
+    domains       ZSET domain -> earliest time it may be claimed again
+    q:<domain>    ZSET work item -> priority (lower first)
+    seen          SET of URLs / searches already enqueued
+    tat           HASH domain -> GCRA theoretical arrival time (rate limit)
+    inflight      HASH domain -> leased items
+    leases        HASH lease id -> "domain\\npriority\\nitem"
+    lease_expiry  ZSET lease id -> expiry time
+    fetched       HASH lease ids whose fetch is done but not yet committed
+    attempts      HASH item -> times reclaimed from a dead worker
+    stats         HASH counters
+
+Claiming, completing and reaping are single Lua scripts, so the
+per-domain rate (GCRA, the shared-state form of a token bucket) and
+in-flight cap hold across all workers. A worker that dies loses nothing:
+its leases expire and the items go back on their domain's queue. A
+fetched item whose result is still waiting to be written hands its
+in-flight slot back (fetched()) but keeps its lease until complete().
+"""
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+SEARCH = "search"
+SWEEP = "sweep"
+ARTICLE = "article"
+
+
+@dataclass
+class FrontierItem:
+    kind: str  # SEARCH, SWEEP or ARTICLE
+    domain: str
+    topic_id: Optional[str] = None
+    url: Optional[str] = None
+    query: Optional[str] = None
+
+    @property
+    def seen_key(self) -> str:
+        if self.kind == ARTICLE:
+            return self.url
+        return f"{self.kind}:{self.domain}:{self.query or ''}"
+
+    def dumps(self) -> str:
+        return json.dumps({k: v for k, v in asdict(self).items() if v is not None}, sort_keys=True)
+
+    @classmethod
+    def loads(cls, data: str) -> "FrontierItem":
+        return cls(**json.loads(data))
+
+
+@dataclass
+class FrontierLease:
+    lease_id: str
+    item: FrontierItem
+    priority: float
+
+
+# KEYS: none (all keys derive from the run prefix)
+# ARGV: prefix, domain, priority, item, seen key, now, interval, burst, max in flight, lease ttl, key ttl
+_ENQUEUE = """
+local p, domain = ARGV[1], ARGV[2]
+if redis.call('SADD', p .. ':seen', ARGV[5]) == 0 then return 0 end
+local q = p .. ':q:' .. domain
+redis.call('ZADD', q, tonumber(ARGV[3]), ARGV[4])
+
+local now, interval, burst = tonumber(ARGV[6]), tonumber(ARGV[7]), tonumber(ARGV[8])
+local allowed = now
+local tat = redis.call('HGET', p .. ':tat', domain)
+if tat then allowed = math.max(now, tonumber(tat) - (burst - 1) * interval) end
+local inflight = tonumber(redis.call('HGET', p .. ':inflight', domain) or '0')
+if inflight >= tonumber(ARGV[9]) then allowed = now + tonumber(ARGV[10]) end
+redis.call('ZADD', p .. ':domains', 'NX', allowed, domain)
+
+redis.call('HINCRBY', p .. ':stats', 'enqueued', 1)
+local ttl = tonumber(ARGV[11])
+for _, key in ipairs({q, p .. ':seen', p .. ':domains', p .. ':stats'}) do
+    redis.call('EXPIRE', key, ttl)
+end
+return 1
+"""
+
+# ARGV: prefix, now, interval, burst, max in flight, lease ttl, lease id, key ttl
+# Returns {0} empty, {1, wait_until} nothing ready yet, {2, item, priority} claimed
+_CLAIM = """
+local p, now = ARGV[1], tonumber(ARGV[2])
+local interval, burst = tonumber(ARGV[3]), tonumber(ARGV[4])
+while true do
+    local ready = redis.call('ZRANGEBYSCORE', p .. ':domains', '-inf', now, 'LIMIT', 0, 1)
+    if #ready == 0 then
+        local nxt = redis.call('ZRANGE', p .. ':domains', 0, 0, 'WITHSCORES')
+        if #nxt == 0 then return {0} end
+        return {1, nxt[2]}
+    end
+
+    local domain = ready[1]
+    local q = p .. ':q:' .. domain
+    local popped = redis.call('ZPOPMIN', q)
+    if #popped > 0 then
+        local item, priority = popped[1], popped[2]
+        local tat = math.max(tonumber(redis.call('HGET', p .. ':tat', domain) or now), now) + interval
+        redis.call('HSET', p .. ':tat', domain, tat)
+        local inflight = redis.call('HINCRBY', p .. ':inflight', domain, 1)
+
+        local lease = ARGV[7]
+        redis.call('HSET', p .. ':leases', lease, domain .. '\\n' .. priority .. '\\n' .. item)
+        redis.call('ZADD', p .. ':lease_expiry', now + tonumber(ARGV[6]), lease)
+        for _, key in ipairs({p .. ':tat', p .. ':inflight', p .. ':leases', p .. ':lease_expiry'}) do
+            redis.call('EXPIRE', key, tonumber(ARGV[8]))
+        end
+
+        if redis.call('ZCARD', q) == 0 then
+            redis.call('ZREM', p .. ':domains', domain)
+        elseif inflight >= tonumber(ARGV[5]) then
+            -- parked until a lease comes back (or expires)
+            redis.call('ZADD', p .. ':domains', now + tonumber(ARGV[6]), domain)
+        else
+            redis.call('ZADD', p .. ':domains', tat - (burst - 1) * interval, domain)
+        end
+        return {2, item, priority}
+    end
+    redis.call('ZREM', p .. ':domains', domain)
+end
+"""
+
+# ARGV: prefix, lease id, now, interval, burst, requeue (0/1), max attempts, outcome, key ttl
+_RELEASE = """
+local p, lease = ARGV[1], ARGV[2]
+local value = redis.call('HGET', p .. ':leases', lease)
+if not value then return 0 end
+redis.call('HDEL', p .. ':leases', lease)
+redis.call('ZREM', p .. ':lease_expiry', lease)
+
+local domain, priority, item = string.match(value, '^([^\\n]*)\\n([^\\n]*)\\n(.*)$')
+-- A fetched lease already gave its in-flight slot back
+if redis.call('HDEL', p .. ':fetched', lease) == 0 then
+    redis.call('HINCRBY', p .. ':inflight', domain, -1)
+end
+local q = p .. ':q:' .. domain
+if ARGV[6] == '1' then
+    local attempts = redis.call('HINCRBY', p .. ':attempts', item, 1)
+    redis.call('EXPIRE', p .. ':attempts', tonumber(ARGV[9]))
+    if attempts <= tonumber(ARGV[7]) then
+        redis.call('ZADD', q, tonumber(priority), item)
+    else
+        redis.call('HINCRBY', p .. ':stats', 'abandoned', 1)
+    end
+end
+redis.call('HINCRBY', p .. ':stats', ARGV[8], 1)
+
+if redis.call('ZCARD', q) > 0 then
+    local now, interval, burst = tonumber(ARGV[3]), tonumber(ARGV[4]), tonumber(ARGV[5])
+    local tat = tonumber(redis.call('HGET', p .. ':tat', domain) or now)
+    redis.call('ZADD', p .. ':domains', math.max(now, tat - (burst - 1) * interval), domain)
+end
+return 1
+"""
+
+# ARGV: prefix, lease id, now, interval, burst, commit ttl, key ttl
+_FETCHED = """
+local p, lease = ARGV[1], ARGV[2]
+local value = redis.call('HGET', p .. ':leases', lease)
+if not value or redis.call('HSETNX', p .. ':fetched', lease, 1) == 0 then return 0 end
+redis.call('EXPIRE', p .. ':fetched', tonumber(ARGV[7]))
+local now = tonumber(ARGV[3])
+redis.call('ZADD', p .. ':lease_expiry', now + tonumber(ARGV[6]), lease)
+
+local domain = string.match(value, '^([^\\n]*)\\n')
+redis.call('HINCRBY', p .. ':inflight', domain, -1)
+if redis.call('ZCARD', p .. ':q:' .. domain) > 0 then
+    local interval, burst = tonumber(ARGV[4]), tonumber(ARGV[5])
+    local tat = tonumber(redis.call('HGET', p .. ':tat', domain) or now)
+    redis.call('ZADD', p .. ':domains', math.max(now, tat - (burst - 1) * interval), domain)
+end
+return 1
+"""
+
+
+class RedisFrontier:
+    """Shared, politeness-aware crawl frontier for one harvest run"""
+
+    def __init__(
+        self,
+        redis_url: str,
+        run_id: str,
+        domain_rate: float = 0.5,
+        domain_burst: float = 2.0,
+        domain_max_in_flight: int = 2,
+        lease_ttl: float = 300.0,
+        max_attempts: int = 2,
+        key_ttl: int = 86400,
+        client=None
+    ):
+        if client is None and aioredis is None:
+            raise RuntimeError("The crawl frontier needs the redis package")
+        self.run_id = run_id
+        self.prefix = f"frontier:{run_id}"
+        self.interval = 1.0 / domain_rate
+        self.burst = max(domain_burst, 1.0)
+        self.max_in_flight = domain_max_in_flight
+        self.lease_ttl = lease_ttl
+        self.max_attempts = max_attempts
+        self.key_ttl = key_ttl
+        self._redis = client or aioredis.from_url(redis_url, decode_responses=True)
+        self._enqueue = self._redis.register_script(_ENQUEUE)
+        self._claim = self._redis.register_script(_CLAIM)
+        self._release = self._redis.register_script(_RELEASE)
+        self._fetched = self._redis.register_script(_FETCHED)
+
+    @staticmethod
+    def new_run_id() -> str:
+        return f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+    async def enqueue(self, item: FrontierItem, priority: float = 0.0) -> bool:
+        """Add an item unless it was already enqueued this run"""
+        added = await self._enqueue(args=[
+            self.prefix, item.domain, priority, item.dumps(), item.seen_key,
+            time.time(), self.interval, self.burst, self.max_in_flight,
+            self.lease_ttl, self.key_ttl,
+        ])
+        return bool(added)
+
+    async def enqueue_many(self, items: Iterable[Tuple[FrontierItem, float]]) -> int:
+        added = 0
+        for item, priority in items:
+            added += await self.enqueue(item, priority)
+        return added
+
+    async def claim(self) -> Union[FrontierLease, float, None]:
+        """
+        Lease the most urgent item from any domain that is ready. Returns
+        the lease, else seconds until some domain is ready, else None when
+        nothing is queued.
+        """
+        await self.reap()
+        lease_id = uuid.uuid4().hex
+        result = await self._claim(args=[
+            self.prefix, time.time(), self.interval, self.burst,
+            self.max_in_flight, self.lease_ttl, lease_id, self.key_ttl,
+        ])
+        if result[0] == 0:
+            return None
+        if result[0] == 1:
+            return max(0.0, float(result[1]) - time.time())
+        return FrontierLease(lease_id, FrontierItem.loads(result[1]), float(result[2]))
+
+    async def fetched(self, lease: FrontierLease) -> None:
+        """
+        The fetch is done: free the domain's in-flight slot while the
+        result waits to be committed. The lease stays open (and is
+        reclaimed if it expires) until complete().
+        """
+        await self._fetched(args=[
+            self.prefix, lease.lease_id, time.time(), self.interval, self.burst,
+            self.lease_ttl, self.key_ttl,
+        ])
+
+    async def complete(self, lease: FrontierLease, ok: bool = True) -> None:
+        """Finish a leased item; failed items are not retried"""
+        await self._release(args=[
+            self.prefix, lease.lease_id, time.time(), self.interval, self.burst,
+            0, self.max_attempts, "done" if ok else "failed", self.key_ttl,
+        ])
+
+    async def reap(self) -> int:
+        """Requeue items whose worker died mid-lease"""
+        expired = await self._redis.zrangebyscore(
+            f"{self.prefix}:lease_expiry", "-inf", time.time()
+        )
+        for lease_id in expired:
+            await self._release(args=[
+                self.prefix, lease_id, time.time(), self.interval, self.burst,
+                1, self.max_attempts, "reclaimed", self.key_ttl,
+            ])
+        return len(expired)
+
+    async def active_leases(self) -> int:
+        return await self._redis.zcard(f"{self.prefix}:lease_expiry")
+
+    async def stats(self) -> Dict[str, int]:
+        raw = await self._redis.hgetall(f"{self.prefix}:stats")
+        return {key: int(value) for key, value in raw.items()}
+
+    async def close(self) -> None:
+        await self._redis.aclose()
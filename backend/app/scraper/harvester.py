@@ -8,18 +8,35 @@ Scrapes articles from configured news outlets using:
 """
 import asyncio
 import random
+import time
+from contextlib import asynccontextmanager, nullcontext
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from urllib.parse import quote_plus, urljoin
-from dataclasses import dataclass
+from urllib.parse import quote_plus
 
 import httpx
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Page, Browser
 
 from app.config import get_settings
+from app.scraper.archive import PageArchive
+from app.scraper.article import ScrapedArticle
+from app.scraper.browser_pool import BrowserPool, get_browser_pool
+from app.scraper.classifier import classify_article
+from app.scraper.dates import parse_date
+from app.scraper.dom_extract import extract_article_fields, extract_links
+from app.scraper.fetch_mode import BROWSER, HTTP, FetchModeSelector
+from app.scraper.health import BLOCKED, EMPTY, RATE_LIMITED, HealthTracker, classify_failure
+from app.scraper.http_pool import HttpClientPool
+from app.scraper.interception import PageLoadMonitor
 from app.scraper.outlets import OutletConfig, get_outlet_config
-from app.scraper.taxonomy import TOPIC_CATEGORIES
+from app.scraper.parse_pool import (
+    ParseExecutor, build_article, parse_article_html, parse_search_html
+)
+from app.scraper.proxies import ProxyManager, ProxySession, get_proxy_manager, is_session_error
+from app.scraper.scheduler import CrawlScheduler
+from app.scraper.search_cache import SearchResultCache
+from app.scraper.sitemaps import SitemapStreamParser, SitemapSweep
+from app.scraper.sweep import SweepCandidate, parse_feed_xml, parse_section_html
+from app.services.known_urls import KnownUrlIndex
 
 settings = get_settings()
 
@@ -33,31 +50,55 @@ USER_AGENTS = [
 ]
 
 
-@dataclass
-class ScrapedArticle:
-    url: str
-    headline: str
-    body: str
-    author: Optional[str] = None
-    published_at: Optional[datetime] = None
-    outlet_domain: str = ""
-    category_tag: Optional[str] = None
-
-
 class ArticleScraper:
     """Main scraper class for harvesting articles"""
     
-    def __init__(self, use_proxy: bool = True):
+    def __init__(
+        self,
+        use_proxy: bool = True,
+        scheduler: Optional[CrawlScheduler] = None,
+        known_urls: Optional[KnownUrlIndex] = None,
+        parser: Optional[ParseExecutor] = None,
+        fetch_modes: Optional[FetchModeSelector] = None,
+        health: Optional[HealthTracker] = None,
+        archive: Optional[PageArchive] = None,
+        search_cache: Optional[SearchResultCache] = None,
+        proxies: Optional[ProxyManager] = None
+    ):
         self.use_proxy = use_proxy
-        self.browser: Optional[Browser] = None
+        self.scheduler = scheduler
+        self.known_urls = known_urls
+        self.parser = parser or ParseExecutor()
+        self.archive = archive
+        self.search_cache = search_cache
+        self.proxies = proxies or get_proxy_manager()
+        self.fetch_modes = fetch_modes or FetchModeSelector(
+            window=settings.fetch_mode_window,
+            min_samples=settings.fetch_mode_min_samples,
+            min_success_rate=settings.fetch_mode_min_success_rate,
+            probe_every=settings.fetch_mode_probe_every,
+        )
+        self.health = health or HealthTracker(
+            failure_threshold=settings.health_failure_threshold,
+            cooldown=settings.health_cooldown_seconds,
+            max_cooldown=settings.health_max_cooldown_seconds,
+        )
+        self.http_pool = HttpClientPool(
+            max_connections_per_host=settings.scraper_max_connections_per_host,
+            keepalive_expiry=settings.scraper_keepalive_expiry,
+            http2=settings.scraper_http2,
+        )
+        self.page_loads = PageLoadMonitor(
+            block_resources=settings.playwright_block_resources,
+            fast_load=settings.playwright_fast_load,
+            content_timeout_ms=settings.playwright_content_timeout_ms,
+        )
         
-    def _get_proxy_url(self) -> Optional[str]:
-        """Get BrightData proxy URL"""
-        if not self.use_proxy or not settings.brightdata_username:
-            return None
-        if "placeholder" in settings.brightdata_password:
-             return None
-        return f"http://{settings.brightdata_username}:{settings.brightdata_password}@{settings.brightdata_host}"
+    def _proxy_session(self, config: OutletConfig) -> Optional[ProxySession]:
+        """Sticky BrightData session for the next request (None = direct)"""
+        return self.proxies.session(
+            config.domain, direct=not (self.use_proxy and config.needs_proxy)
+        )
     
     def _get_random_user_agent(self) -> str:
         """Get random user agent for rotation"""
@@ -65,53 +106,106 @@ class ArticleScraper:
     
     def classify_article(self, headline: str, body: str) -> Optional[str]:
         """Classify article into taxonomy category based on keywords"""
-        text = (headline + " " + body).lower()
-        
-        best_category = None
-        max_matches = 0
-        
-        for category, config in TOPIC_CATEGORIES.items():
-            matches = sum(1 for keyword in config["keywords"] if keyword in text)
-            if matches > max_matches:
-                max_matches = matches
-                best_category = category
-                
-        # Only assign if we have a reasonable confidence (at least 2 keyword matches)
-        if max_matches >= 2:
-            return best_category
-        return None
+        return classify_article(headline, body)
     
-    async def _init_browser(self) -> Browser:
-        """Initialize Playwright browser"""
-        if self.browser:
-            return self.browser
-            
-        playwright = await async_playwright().start()
-        
-        browser_args = {
-            "headless": True,
-            "args": [
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox"
-            ]
-        }
-        
-        if self.use_proxy and settings.brightdata_username and "placeholder" not in settings.brightdata_password:
-            browser_args["proxy"] = {
-                "server": f"http://{settings.brightdata_host}",
-                "username": settings.brightdata_username,
-                "password": settings.brightdata_password
-            }
-        
-        self.browser = await playwright.chromium.launch(**browser_args)
-        return self.browser
+    def _get_browser_pool(self, config: OutletConfig) -> BrowserPool:
+        """Process-wide warm browser shared across outlets and topics"""
+        return get_browser_pool(self.use_proxy and config.needs_proxy, USER_AGENTS)
+    
+    def _slot(self, config: OutletConfig):
+        """Politeness slot for one request to an outlet (no-op without a scheduler)"""
+        if self.scheduler:
+            return self.scheduler.slot(config.domain)
+        return nullcontext()
+    
+    async def _archive(
+        self,
+        url: str,
+        config: OutletConfig,
+        content: bytes,
+        encoding: Optional[str] = None,
+        kind: str = "article"
+    ) -> None:
+        """Keep the raw page for offline re-extraction (never fails the fetch)"""
+        if self.archive is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self.archive.put, url, config.domain, content, encoding, kind
+            )
+        except Exception as e:
+            print(f"Archive error for {url}: {e}")
+    
+    def _record(
+        self,
+        config: OutletConfig,
+        error: Optional[BaseException],
+        empty: bool = False
+    ) -> None:
+        """
+        Feed the final outcome of a search or article fetch (after any
+        escalation to the browser) to the outlet's circuit breaker. Thin
+        results are the fetch mode's concern, not a failure of the outlet.
+        """
+        if error is not None:
+            self.health.record_exception(config.domain, error)
+        elif empty:
+            self.health.record_failure(config.domain, EMPTY)
+        else:
+            self.health.record_success(config.domain)
+    
+    def _escalates(self, error: Optional[BaseException]) -> bool:
+        """
+        Whether a failed HTTP fetch is worth retrying in the browser. Not
+        when the outlet refused us (401/403/429) or the exit IP is bad: a
+        render would be refused too, and the refusal is the breaker's.
+        """
+        if error is None:
+            return True
+        if classify_failure(error)[0] in (BLOCKED, RATE_LIMITED):
+            return False
+        return not (isinstance(error, httpx.HTTPStatusError) and is_session_error(error))
+    
+    @asynccontextmanager
+    async def _http_client(self, config: OutletConfig):
+        """
+        Pooled keep-alive client for one request to an outlet, through a
+        proxy session that is timed and scored. Enter it inside the
+        politeness slot, so the session is picked when the request actually
+        goes out; a retired session's client is closed only once no request
+        holds it.
+        """
+        session = self._proxy_session(config)
+        if session is None:
+            yield await self.http_pool.get(config.domain)
+            return
+        self.proxies.begin(session)
+        started = time.monotonic()
+        error = False
+        try:
+            yield await self.http_pool.get(config.domain, session.url)
+        except Exception as e:
+            error = is_session_error(e)
+            raise
+        finally:
+            if self.proxies.finish(session, time.monotonic() - started, error):
+                await self.http_pool.discard(session.domain, session.url)
     
     async def close(self):
-        """Close browser"""
-        if self.browser:
-            await self.browser.close()
-            self.browser = None
+        """
+        Close pooled HTTP clients, the parse executor, the archive and the
+        search cache (after its background refreshes finish).
+        
+        The browser pool is process-wide; harvest runs shut it down with
+        close_browser_pools() once every scraper is done.
+        """
+        if self.search_cache is not None:
+            await self.search_cache.close()
+        await self.http_pool.close()
+        # Waiting for parse workers to exit blocks, so not on the event loop
+        await asyncio.to_thread(self.parser.shutdown)
+        if self.archive is not None:
+            self.archive.close()
     
     async def search_outlet(
         self,
@@ -121,20 +215,67 @@ class ArticleScraper:
     ) -> List[str]:
         """
         Search an outlet for articles matching a query.
-        Returns list of article URLs.
+        Returns list of article URLs, from the search cache when it has them.
         """
+        if self.search_cache is None:
+            return await self._search_live(outlet_config, query, max_articles)
+        return await self.search_cache.lookup(
+            outlet_config.domain,
+            query,
+            max_articles,
+            lambda: self._search_live(outlet_config, query, max_articles)
+        )
+    
+    async def _search_live(
+        self,
+        outlet_config: OutletConfig,
+        query: str,
+        max_articles: int
+    ) -> List[str]:
+        """Fetch an outlet's search page, escalating to the browser if needed"""
         search_url = outlet_config.search_url_template.format(
             query=quote_plus(query)
         )
         
-        if outlet_config.needs_javascript:
-            return await self._search_with_playwright(
-                search_url, outlet_config, max_articles
-            )
-        else:
-            return await self._search_with_httpx(
+        domain = outlet_config.domain
+        # One breaker check per search: in HALF_OPEN the whole search,
+        # browser fallback included, is the probe
+        if not self.health.allow(domain):
+            return []
+        
+        http_error = None
+        if self.fetch_modes.start_mode(domain, "search") == HTTP:
+            try:
+                urls = await self._search_with_httpx(
+                    search_url, outlet_config, max_articles
+                )
+            except Exception as e:
+                print(f"Search error for {domain}: {e}")
+                urls = []
+                http_error = e
+            if not self._escalates(http_error):
+                self._record(outlet_config, http_error)
+                return []
+            self.fetch_modes.record(domain, "search", HTTP, bool(urls))
+            if urls:
+                self._record(outlet_config, None)
+                return urls
+            self.fetch_modes.record_escalation(domain)
+        
+        error = None
+        try:
+            urls = await self._search_with_playwright(
                 search_url, outlet_config, max_articles
             )
+        except Exception as e:
+            print(f"Playwright search error for {domain}: {e}")
+            urls = []
+            error = e
+        self.fetch_modes.record(domain, "search", BROWSER, bool(urls))
+        # No results for a topic is an answer, not an outlet failure, unless
+        # the HTTP attempt had already failed
+        self._record(outlet_config, error or (None if urls else http_error))
+        return urls
     
     async def _search_with_httpx(
         self,
@@ -142,30 +283,23 @@ class ArticleScraper:
         config: OutletConfig,
         max_articles: int
     ) -> List[str]:
-        """Search using httpx for non-JS sites"""
+        """Search using httpx (errors propagate to _search_live)"""
         headers = {"User-Agent": self._get_random_user_agent()}
-        proxy = self._get_proxy_url()
         
-        async with httpx.AsyncClient(proxy=proxy, timeout=30) as client:
-            try:
-                response = await client.get(search_url, headers=headers)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, "lxml")
-                links = soup.select(config.article_selector)
-                
-                urls = []
-                for link in links[:max_articles]:
-                    href = link.get("href")
-                    if href:
-                        full_url = urljoin(f"https://{config.domain}", href)
-                        urls.append(full_url)
-                
-                return urls
-                
-            except Exception as e:
-                print(f"Search error for {config.domain}: {e}")
-                return []
+        async with self._slot(config), self._http_client(config) as client:
+            response = await client.get(search_url, headers=headers)
+            response.raise_for_status()
+        await self._archive(
+            search_url, config, response.content, response.encoding, "search"
+        )
+        
+        return await self.parser.run(
+            parse_search_html,
+            response.content,
+            config,
+            max_articles,
+            response.encoding
+        )
     
     async def _search_with_playwright(
         self,
@@ -173,208 +307,293 @@ class ArticleScraper:
         config: OutletConfig,
         max_articles: int
     ) -> List[str]:
-        """Search using Playwright for JS-rendered sites"""
-        browser = await self._init_browser()
-        context = await browser.new_context(
-            user_agent=self._get_random_user_agent()
+        """Search using Playwright for JS-rendered sites (errors propagate)"""
+        # Lease the page first: waiting on the browser pool inside the slot
+        # would hold the outlet's in-flight and global slots (and spend its
+        # rate token) on a request that cannot go out yet
+        async with self._get_browser_pool(config).page() as page, self._slot(config):
+            await self.page_loads.load(
+                page, search_url, config.domain, config.article_selector
+            )
+            return await extract_links(page, config, max_articles)
+    
+    async def sweep_outlet(self, outlet_config: OutletConfig) -> List[SweepCandidate]:
+        """
+        Candidate articles from an outlet's feeds and section fronts,
+        fetched once per run. Listings are plain HTTP even for outlets
+        whose search needs JavaScript.
+        """
+        jobs = [(url, parse_feed_xml) for url in outlet_config.feed_urls]
+        jobs += [(url, parse_section_html) for url in outlet_config.section_urls]
+        listings = await asyncio.gather(
+            *(self._fetch_listing(url, outlet_config, parse) for url, parse in jobs)
         )
-        page = await context.new_page()
+        
+        candidates = {}
+        for listing in listings:
+            for candidate in listing:
+                candidates.setdefault(candidate.url, candidate)
+        return list(candidates.values())
+    
+    async def _fetch_listing(
+        self,
+        url: str,
+        config: OutletConfig,
+        parse
+    ) -> List[SweepCandidate]:
+        """Fetch one feed or section front and parse it off the event loop"""
+        if not self.health.allow(config.domain):
+            return []
+        headers = {"User-Agent": self._get_random_user_agent()}
         
         try:
-            await page.goto(search_url, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(random.uniform(1, 3))  # Random delay
-            
-            links = await page.query_selector_all(config.article_selector)
+            async with self._slot(config), self._http_client(config) as client:
+                response = await client.get(url, headers=headers, follow_redirects=True)
+                response.raise_for_status()
             
-            urls = []
-            for link in links[:max_articles]:
-                href = await link.get_attribute("href")
-                if href:
-                    full_url = urljoin(f"https://{config.domain}", href)
-                    urls.append(full_url)
+            self.health.record_success(config.domain)
+            await self._archive(
+                url, config, response.content, response.encoding, "listing"
+            )
             
-            return urls
+            return await self.parser.run(
+                parse,
+                response.content,
+                config,
+                str(response.url),
+                response.encoding
+            )
             
         except Exception as e:
-            print(f"Playwright search error for {config.domain}: {e}")
+            self.health.record_exception(config.domain, e)
+            print(f"Listing error for {url}: {e}")
             return []
-        finally:
-            await context.close()
+    
+    async def sitemap_outlet(
+        self,
+        outlet_config: OutletConfig,
+        since: Optional[datetime] = None
+    ) -> SitemapSweep:
+        """
+        New or changed articles from an outlet's news sitemaps since the
+        `since` high-water mark, following sitemap indexes.
+        """
+        sweep = SitemapSweep(since)
+        for url in outlet_config.sitemap_urls:
+            sweep.queue(url)
+        
+        url = sweep.next_sitemap()
+        while url:
+            await self._stream_sitemap(url, outlet_config, sweep)
+            url = sweep.next_sitemap()
+        return sweep
+    
+    async def _stream_sitemap(
+        self,
+        url: str,
+        config: OutletConfig,
+        sweep: SitemapSweep
+    ) -> None:
+        """Parse a sitemap chunk by chunk as it downloads"""
+        if not self.health.allow(config.domain):
+            sweep.incomplete = True
+            return
+        headers = {"User-Agent": self._get_random_user_agent()}
+        parser = SitemapStreamParser()
+        
+        try:
+            async with self._slot(config), self._http_client(config) as client:
+                async with client.stream(
+                    "GET", url, headers=headers, follow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        for entry in parser.feed(chunk):
+                            sweep.add(entry)
+            for entry in parser.close():
+                sweep.add(entry)
+            self.health.record_success(config.domain)
+            
+        except Exception as e:
+            self.health.record_exception(config.domain, e)
+            sweep.incomplete = True
+            print(f"Sitemap error for {url}: {e}")
     
     async def scrape_article(
         self,
         url: str,
-        outlet_config: OutletConfig
+        outlet_config: OutletConfig,
+        failed: Optional[List[str]] = None
     ) -> Optional[ScrapedArticle]:
         """
-        Scrape a single article.
+        Scrape a single article. If it could not be fetched (errors, an
+        open circuit), as opposed to fetched with nothing to extract, the
+        URL is appended to `failed` if given.
         """
-        if outlet_config.needs_javascript:
-            return await self._scrape_with_playwright(url, outlet_config)
-        else:
-            return await self._scrape_with_httpx(url, outlet_config)
+        domain = outlet_config.domain
+        article = None
+        # One breaker check per article: in HALF_OPEN the whole fetch,
+        # browser fallback included, is the probe
+        if not self.health.allow(domain):
+            if failed is not None:
+                failed.append(url)
+            return None
+        
+        http_error = None
+        if self.fetch_modes.start_mode(domain, "article") == HTTP:
+            try:
+                article = await self._scrape_with_httpx(url, outlet_config)
+            except Exception as e:
+                print(f"Scrape error for {url}: {e}")
+                http_error = e
+            if not self._escalates(http_error):
+                self._record(outlet_config, http_error)
+                if failed is not None:
+                    failed.append(url)
+                return None
+            complete = self._is_complete(article)
+            self.fetch_modes.record(domain, "article", HTTP, complete)
+            if complete:
+                self._record(outlet_config, None)
+                return article
+            self.fetch_modes.record_escalation(domain)
+        
+        rendered = None
+        error = None
+        try:
+            rendered = await self._scrape_with_playwright(url, outlet_config)
+        except Exception as e:
+            print(f"Playwright scrape error for {url}: {e}")
+            error = e
+        self.fetch_modes.record(domain, "article", BROWSER, self._is_complete(rendered))
+        article = rendered or article
+        # A short article still came back; nothing extracted at all (block
+        # pages, consent walls) is what counts against the outlet, as the
+        # HTTP attempt's error when it had one
+        error = error or http_error
+        self._record(outlet_config, error if article is None else None, empty=article is None)
+        if article is None and error is not None and failed is not None:
+            failed.append(url)
+        return article
+    
+    def _is_complete(self, article: Optional[ScrapedArticle]) -> bool:
+        """Extraction worked: headline and body of a plausible length"""
+        return bool(
+            article
+            and len(article.headline) >= settings.article_min_headline_chars
+            and len(article.body) >= settings.article_min_body_chars
+        )
     
     async def _scrape_with_httpx(
         self,
         url: str,
         config: OutletConfig
     ) -> Optional[ScrapedArticle]:
-        """Scrape article using httpx"""
+        """Scrape article using httpx (errors propagate to scrape_article)"""
         headers = {"User-Agent": self._get_random_user_agent()}
-        proxy = self._get_proxy_url()
         
-        async with httpx.AsyncClient(proxy=proxy, timeout=30) as client:
-            try:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, "lxml")
-                
-                # Extract headline
-                headline_el = soup.select_one(config.headline_selector)
-                headline = headline_el.get_text(strip=True) if headline_el else ""
-                
-                # Extract body
-                body_elements = soup.select(config.body_selector)
-                body = "\n\n".join([p.get_text(strip=True) for p in body_elements])
-                
-                # Extract author
-                author = None
-                if config.author_selector:
-                    author_el = soup.select_one(config.author_selector)
-                    author = author_el.get_text(strip=True) if author_el else None
-                
-                # Extract date
-                published_at = None
-                if config.date_selector:
-                    date_el = soup.select_one(config.date_selector)
-                    if date_el:
-                        date_str = date_el.get("datetime") or date_el.get_text(strip=True)
-                        published_at = self._parse_date(date_str)
-                
-                if not headline or not body:
-                    return None
-                
-                category_tag = self.classify_article(headline, body)
-                
-                return ScrapedArticle(
-                    url=url,
-                    headline=headline,
-                    body=body,
-                    author=author,
-                    published_at=published_at,
-                    outlet_domain=config.domain,
-                    category_tag=category_tag
-                )
-                
-            except Exception as e:
-                print(f"Scrape error for {url}: {e}")
-                return None
-    
+        async with self._slot(config), self._http_client(config) as client:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+        # Header charset, else UTF-8 (as response.text decoded it), never lxml's Latin-1 guess
+        await self._archive(url, config, response.content, response.encoding)
+        
+        # Extraction, classification and date parsing run off the event loop
+        return await self.parser.run(
+            parse_article_html,
+            response.content,
+            config,
+            url,
+            response.encoding
+        )
+
     async def _scrape_with_playwright(
         self,
         url: str,
         config: OutletConfig
     ) -> Optional[ScrapedArticle]:
-        """Scrape article using Playwright"""
-        browser = await self._init_browser()
-        context = await browser.new_context(
-            user_agent=self._get_random_user_agent()
-        )
-        page = await context.new_page()
-        
-        try:
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(random.uniform(1, 2))
-            
-            # Extract headline
-            headline = ""
-            headline_el = await page.query_selector(config.headline_selector)
-            if headline_el:
-                headline = await headline_el.inner_text()
-            
-            # Extract body
-            body_elements = await page.query_selector_all(config.body_selector)
-            body_parts = []
-            for el in body_elements:
-                text = await el.inner_text()
-                if text.strip():
-                    body_parts.append(text.strip())
-            body = "\n\n".join(body_parts)
-            
-            # Extract author
-            author = None
-            if config.author_selector:
-                author_el = await page.query_selector(config.author_selector)
-                if author_el:
-                    author = await author_el.inner_text()
-            
-            # Extract date
-            published_at = None
-            if config.date_selector:
-                date_el = await page.query_selector(config.date_selector)
-                if date_el:
-                    date_str = await date_el.get_attribute("datetime")
-                    if not date_str:
-                        date_str = await date_el.inner_text()
-                    published_at = self._parse_date(date_str)
-            
-            if not headline or not body:
-                return None
-            
-            category_tag = self.classify_article(headline, body)
-            
-            return ScrapedArticle(
-                url=url,
-                headline=headline,
-                body=body,
-                author=author,
-                published_at=published_at,
-                outlet_domain=config.domain,
-                category_tag=category_tag
+        """Scrape article using Playwright (errors propagate to scrape_article)"""
+        # Page lease before the politeness slot, as in _search_with_playwright
+        async with self._get_browser_pool(config).page() as page, self._slot(config):
+            await self.page_loads.load(
+                page, url, config.domain, config.body_selector
             )
             
-        except Exception as e:
-            print(f"Playwright scrape error for {url}: {e}")
-            return None
-        finally:
-            await context.close()
+            # Headline, body, author and date in a single round trip
+            fields = await extract_article_fields(page, config)
+            html = await page.content() if self.archive is not None else None
+        
+        if html is not None:
+            await self._archive(url, config, html.encode("utf-8"), "utf-8")
+        
+        return await self.parser.run(build_article, fields, config, url)
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats"""
-        if not date_str:
-            return None
-            
-        from dateutil import parser
-        try:
-            return parser.parse(date_str)
-        except:
-            return None
+        return parse_date(date_str)
 
 
 async def scrape_topic_from_outlet(
     outlet_config: OutletConfig,
     topic_query: str,
-    max_articles: int = 5
+    max_articles: int = 5,
+    scraper: Optional[ArticleScraper] = None
 ) -> List[ScrapedArticle]:
     """
     Scrape articles about a topic from a single outlet.
+    
+    Pass a long-lived scraper to reuse its HTTP clients across calls. If
+    it has a scheduler, article fetches run concurrently and are paced by
+    the outlet's token bucket instead of fixed sleeps.
     """
-    scraper = ArticleScraper()
+    owns_scraper = scraper is None
+    if owns_scraper:
+        scraper = ArticleScraper()
     articles = []
     
     try:
         # Search for articles
         urls = await scraper.search_outlet(outlet_config, topic_query, max_articles)
-        
-        # Add delay between requests
-        for url in urls:
-            await asyncio.sleep(random.uniform(2, 4))
-            
-            article = await scraper.scrape_article(url, outlet_config)
-            if article:
-                articles.append(article)
+        articles = await scrape_article_urls(outlet_config, urls, scraper)
     finally:
-        await scraper.close()
+        if owns_scraper:
+            await scraper.close()
+    
+    return articles
+
+
+async def scrape_article_urls(
+    outlet_config: OutletConfig,
+    urls: List[str],
+    scraper: ArticleScraper,
+    failed: Optional[List[str]] = None
+) -> List[ScrapedArticle]:
+    """
+    Fetch and parse article URLs found by a search or a sweep, skipping
+    any that are already stored. URLs that were not fetched (errors, an
+    open circuit) are appended to `failed` if given; pages that were
+    fetched but had no article in them are not.
+    """
+    # Drop articles we already stored before paying for the fetch
+    if scraper.known_urls:
+        urls = await scraper.known_urls.filter_new(urls)
+    
+    if scraper.scheduler:
+        results = await asyncio.gather(
+            *(scraper.scrape_article(url, outlet_config, failed) for url in urls)
+        )
+        return [article for article in results if article]
     
+    articles = []
+    # Add delay between requests
+    for i, url in enumerate(urls):
+        if scraper.health.is_open(outlet_config.domain):
+            if failed is not None:
+                failed.extend(urls[i:])
+            break  # no point sleeping through a cool-down
+        await asyncio.sleep(random.uniform(2, 4))
+        
+        article = await scraper.scrape_article(url, outlet_config, failed)
+        if article:
+            articles.append(article)
     return articles
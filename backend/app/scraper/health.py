@@ -0,0 +1,178 @@
+"""
+Outlet Health
+
+Per-domain circuit breaker for the harvester. Consecutive failures
+(timeouts, 403 blocks, 429 rate limits, empty extractions, errors) open
+an outlet's circuit for a cool-down, during which its fetches are skipped
+instead of each waiting out a timeout. After the cool-down a single probe
+request is let through: success closes the circuit, failure re-opens it
+for twice as long, up to a ceiling.
+"""
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+TIMEOUT = "timeout"
+BLOCKED = "blocked"
+RATE_LIMITED = "rate_limited"
+EMPTY = "empty"
+ERROR = "error"
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_failure(exc: BaseException) -> Tuple[str, Optional[float]]:
+    """Failure kind for an exception, plus any Retry-After in seconds"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        if status == 429:
+            return RATE_LIMITED, _retry_after(exc.response)
+        if status in (401, 403):
+            return BLOCKED, None
+        return ERROR, None
+    # Playwright raises its own TimeoutError class
+    if isinstance(exc, (httpx.TimeoutException, asyncio.TimeoutError)) or type(exc).__name__ == "TimeoutError":
+        return TIMEOUT, None
+    return ERROR, None
+
+
+@dataclass
+class DomainHealth:
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    reopen_count: int = 0  # trips since the circuit last closed, drives backoff
+    open_until: float = 0.0
+    probing: bool = False
+    successes: int = 0
+    failures: Counter = field(default_factory=Counter)
+    trips: int = 0
+    skipped: int = 0
+    open_seconds: float = 0.0
+
+
+class HealthTracker:
+    """Circuit breakers for every outlet in a harvest run"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 60.0,
+        max_cooldown: float = 900.0
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.domains: Dict[str, DomainHealth] = {}
+
+    def _health(self, domain: str) -> DomainHealth:
+        health = self.domains.get(domain)
+        if health is None:
+            health = DomainHealth()
+            self.domains[domain] = health
+        return health
+
+    def is_open(self, domain: str) -> bool:
+        """True while the domain is cooling down"""
+        health = self.domains.get(domain)
+        return bool(health and health.state == OPEN and time.monotonic() < health.open_until)
+
+    def allow(self, domain: str) -> bool:
+        """Whether a request to `domain` may go out now"""
+        health = self._health(domain)
+        if health.state == CLOSED:
+            return True
+
+        if health.state == OPEN and time.monotonic() >= health.open_until:
+            health.state = HALF_OPEN
+            health.probing = False
+        if health.state == HALF_OPEN and not health.probing:
+            health.probing = True  # let exactly one probe through
+            return True
+
+        health.skipped += 1
+        return False
+
+    def record_success(self, domain: str) -> None:
+        health = self._health(domain)
+        health.successes += 1
+        health.consecutive_failures = 0
+        health.reopen_count = 0
+        health.probing = False
+        health.state = CLOSED
+
+    def record_failure(
+        self,
+        domain: str,
+        kind: str,
+        retry_after: Optional[float] = None
+    ) -> None:
+        health = self._health(domain)
+        health.failures[kind] += 1
+        health.consecutive_failures += 1
+
+        if health.state == OPEN:
+            return  # a request that was already in flight when we opened
+        if (
+            health.state == HALF_OPEN
+            or kind == RATE_LIMITED
+            or health.consecutive_failures >= self.failure_threshold
+        ):
+            self._open(health, retry_after)
+
+    def record_exception(self, domain: str, exc: BaseException) -> None:
+        kind, retry_after = classify_failure(exc)
+        self.record_failure(domain, kind, retry_after)
+
+    def _open(self, health: DomainHealth, retry_after: Optional[float]) -> None:
+        cooldown = min(self.cooldown * 2 ** health.reopen_count, self.max_cooldown)
+        if retry_after:
+            cooldown = max(cooldown, min(retry_after, self.max_cooldown))
+        health.state = OPEN
+        health.probing = False
+        health.open_until = time.monotonic() + cooldown
+        health.reopen_count += 1
+        health.trips += 1
+        health.open_seconds += cooldown
+
+    def summary(self) -> Dict[str, Dict[str, object]]:
+        """Per-domain circuit state and failure breakdown"""
+        return {
+            domain: {
+                "state": OPEN if self.is_open(domain) else health.state,
+                "successes": health.successes,
+                "failures": dict(health.failures),
+                "trips": health.trips,
+                "skipped": health.skipped,
+                "open_s": round(health.open_seconds),
+            }
+            for domain, health in sorted(self.domains.items())
+        }
+
+    def print_summary(self) -> None:
+        print("Outlet health:")
+        for domain, row in self.summary().items():
+            failures = ", ".join(f"{kind} {n}" for kind, n in sorted(row["failures"].items())) or "none"
+            print(
+                f"  {domain:<22} {row['state']:<9} {row['successes']:>4} ok  "
+                f"failures: {failures}  "
+                f"{row['trips']} trips, {row['skipped']} skipped, {row['open_s']}s open"
+            )
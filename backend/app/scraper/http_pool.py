@@ -0,0 +1,82 @@
+"""
+HTTP Client Pool
+
+Long-lived httpx clients shared by the harvester. One client is kept per
+(domain, proxy) pair so TLS sessions and keep-alive connections survive
+across the thousands of fetches in a harvest run.
+"""
+import asyncio
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    # Install with: pip install "httpx[http2]"
+    HTTP2_AVAILABLE = False
+
+
+ClientKey = Tuple[str, Optional[str]]
+
+
+class HttpClientPool:
+    """Pool of keep-alive httpx clients keyed by (domain, proxy)"""
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 6,
+        keepalive_expiry: float = 60.0,
+        timeout: float = 30.0,
+        http2: bool = True,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._clients: Dict[ClientKey, httpx.AsyncClient] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(self, domain: str, proxy: Optional[str] = None) -> httpx.AsyncClient:
+        """Get (or lazily create) the client for a domain/proxy pair"""
+        key = (domain, proxy)
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    proxy=proxy,
+                    timeout=self.timeout,
+                    limits=self.limits,
+                    http2=self.http2,
+                )
+                self._clients[key] = client
+            return client
+
+    async def discard(self, domain: str, proxy: Optional[str] = None) -> None:
+        """Close and forget one client (e.g. for a retired proxy session)"""
+        async with self._lock:
+            client = self._clients.pop((domain, proxy), None)
+        if client is not None:
+            await client.aclose()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def close(self) -> None:
+        """Close every pooled client"""
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        await asyncio.gather(
+            *(client.aclose() for client in clients),
+            return_exceptions=True
+        )
@@ -0,0 +1,29 @@
+"""
+Markup helpers shared by the streaming feed and sitemap parsers and the
+structured metadata scan
+"""
+import re
+
+from lxml import etree
+
+_TAGS = re.compile(r"<[^>]+>")
+
+
+def localname(el: etree._Element) -> str:
+    """Tag name without its namespace"""
+    return etree.QName(el).localname
+
+
+def release(el: etree._Element) -> None:
+    """
+    Clear an element a pull parser has finished with, and drop the
+    siblings read before it, so memory stays flat on big documents.
+    """
+    el.clear()
+    while el.getprevious() is not None:
+        del el.getparent()[0]
+
+
+def strip_tags(text: str) -> str:
+    """Replace every tag with a space (entities are left escaped)"""
+    return _TAGS.sub(" ", text)
@@ -0,0 +1,78 @@
+"""
+spaCy Model Provider
+
+Loading en_core_web_sm (and importing spaCy at all) takes a second or
+more and tens of MB per process. It used to happen at import time of
+app.scraper.discovery, so every process that imported it paid, including
+every Celery worker via the app's task includes. The model is now loaded
+on first use, once per process, and discovery-queue workers load it up
+front in warm_up() so the first task does not wait for it.
+"""
+import threading
+import time
+from typing import Optional
+
+MODEL_NAME = "en_core_web_sm"
+
+_nlp = None
+_loaded = False
+_lock = threading.Lock()
+
+
+def ner_only(nlp):
+    """
+    Disable every component NER does not need (tagger, parser,
+    lemmatizer, ...). Only doc.ents is used, and the rest of the pipeline
+    costs several times what NER does.
+    """
+    keep = {"ner"}
+    for name, component in nlp.pipeline:
+        # Shared tok2vec layers that NER listens to must stay on
+        if "ner" in getattr(component, "listening_components", []):
+            keep.add(name)
+    nlp.select_pipes(disable=[name for name in nlp.pipe_names if name not in keep])
+    return nlp
+
+
+def get_nlp():
+    """The process's NER pipeline, loaded on first call; None if unavailable"""
+    global _nlp, _loaded
+    if _loaded:
+        return _nlp
+
+    with _lock:
+        if not _loaded:
+            try:
+                import spacy
+                _nlp = ner_only(spacy.load(MODEL_NAME))
+            except (ImportError, OSError):
+                # Model not installed - will need to run: python -m spacy download en_core_web_sm
+                _nlp = None
+            _loaded = True
+    return _nlp
+
+
+def set_nlp(nlp) -> None:
+    """Use a given pipeline instead of loading the model (benchmarks)"""
+    global _nlp, _loaded
+    with _lock:
+        _nlp = nlp
+        _loaded = True
+
+
+def model_id() -> str:
+    """Identifies what produced cached entities (name-version, or the keyword fallback)"""
+    nlp = get_nlp()
+    if nlp is None:
+        return "keywords"
+    return f"{nlp.meta.get('lang', 'xx')}_{nlp.meta.get('name', 'pipeline')}-{nlp.meta.get('version', '0')}"
+
+
+def warm_up() -> Optional[float]:
+    """Load the model and run one document through it; returns seconds taken"""
+    started = time.perf_counter()
+    nlp = get_nlp()
+    if nlp is None:
+        return None
+    nlp("Warm-up sentence about the Senate in Washington.")
+    return time.perf_counter() - started
@@ -3,7 +3,7 @@ Outlet-specific scraper configurations.
 
 Each outlet has different HTML structures, so we need custom selectors.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List
 
 
@@ -17,9 +17,14 @@ class OutletConfig:
     body_selector: str  # CSS selector for body in article
     author_selector: Optional[str] = None
     date_selector: Optional[str] = None
-    needs_javascript: bool = False  # Use Playwright if True
+    needs_javascript: bool = False  # JS-rendered; HTTP is still tried first
     monthly_visits: int = 0
     is_wire_service: bool = False
+    needs_proxy: bool = True  # False routes the outlet's requests direct
+    # Listing pages for sweep discovery (see app/scraper/sweep.py)
+    feed_urls: List[str] = field(default_factory=list)
+    section_urls: List[str] = field(default_factory=list)
+    sitemap_urls: List[str] = field(default_factory=list)  # Google News sitemaps
 
 
 # Top 20 News Outlets Configuration
@@ -35,7 +40,10 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.Component-bylines",
         date_selector="span.Timestamp",
         monthly_visits=148_000_000,
-        is_wire_service=True
+        is_wire_service=True,
+        sitemap_urls=[
+            "https://apnews.com/news-sitemap-content.xml",
+        ]
     ),
     OutletConfig(
         name="Reuters",
@@ -48,7 +56,10 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         date_selector="time",
         needs_javascript=True,
         monthly_visits=148_000_000,
-        is_wire_service=True
+        is_wire_service=True,
+        sitemap_urls=[
+            "https://www.reuters.com/arc/outboundfeeds/news-sitemap/?outputType=xml",
+        ]
     ),
     
     # Major Outlets (Scored)
@@ -62,7 +73,16 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.css-1baulvz",
         date_selector="time",
         needs_javascript=True,
-        monthly_visits=620_000_000
+        monthly_visits=620_000_000,
+        feed_urls=[
+            "https://rss.nytimes.com/services/xml/rss/nyt/HomePage.xml",
+            "https://rss.nytimes.com/services/xml/rss/nyt/US.xml",
+            "https://rss.nytimes.com/services/xml/rss/nyt/Politics.xml",
+            "https://rss.nytimes.com/services/xml/rss/nyt/World.xml",
+        ],
+        sitemap_urls=[
+            "https://www.nytimes.com/sitemaps/new/news.xml.gz",
+        ]
     ),
     OutletConfig(
         name="CNN",
@@ -74,7 +94,15 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.byline__name",
         date_selector="div.timestamp",
         needs_javascript=True,
-        monthly_visits=300_000_000
+        monthly_visits=300_000_000,
+        feed_urls=[
+            "http://rss.cnn.com/rss/cnn_topstories.rss",
+            "http://rss.cnn.com/rss/cnn_allpolitics.rss",
+            "http://rss.cnn.com/rss/cnn_world.rss",
+        ],
+        sitemap_urls=[
+            "https://www.cnn.com/sitemaps/cnn/news.xml",
+        ]
     ),
     OutletConfig(
         name="Fox News",
@@ -86,7 +114,15 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.author-byline a",
         date_selector="time",
         needs_javascript=True,
-        monthly_visits=250_000_000
+        monthly_visits=250_000_000,
+        feed_urls=[
+            "https://moxie.foxnews.com/google-publisher/latest.xml",
+            "https://moxie.foxnews.com/google-publisher/politics.xml",
+            "https://moxie.foxnews.com/google-publisher/world.xml",
+        ],
+        sitemap_urls=[
+            "https://www.foxnews.com/sitemap.xml?type=news",
+        ]
     ),
     OutletConfig(
         name="Washington Post",
@@ -98,7 +134,12 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="a.author-name",
         date_selector="time",
         needs_javascript=True,
-        monthly_visits=180_000_000
+        monthly_visits=180_000_000,
+        feed_urls=[
+            "https://feeds.washingtonpost.com/rss/national",
+            "https://feeds.washingtonpost.com/rss/politics",
+            "https://feeds.washingtonpost.com/rss/world",
+        ]
     ),
     OutletConfig(
         name="USA Today",
@@ -109,7 +150,19 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         body_selector="article p.gnt_ar_b_p",
         author_selector="a.gnt_ar_by_a",
         date_selector="div.gnt_ar_dt",
-        monthly_visits=150_000_000
+        monthly_visits=150_000_000,
+        feed_urls=[
+            "https://rssfeeds.usatoday.com/usatoday-NewsTopStories",
+            "https://rssfeeds.usatoday.com/UsatodaycomWashington-TopStories",
+            "https://rssfeeds.usatoday.com/UsatodaycomWorld-TopStories",
+        ],
+        section_urls=[
+            "https://www.usatoday.com/news/politics/",
+            "https://www.usatoday.com/news/world/",
+        ],
+        sitemap_urls=[
+            "https://www.usatoday.com/news-sitemap.xml",
+        ]
     ),
     OutletConfig(
         name="CNBC",
@@ -121,7 +174,15 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="a.Author-authorName",
         date_selector="time",
         needs_javascript=True,
-        monthly_visits=127_000_000
+        monthly_visits=127_000_000,
+        feed_urls=[
+            "https://www.cnbc.com/id/100003114/device/rss/rss.html",
+            "https://www.cnbc.com/id/10000113/device/rss/rss.html",
+            "https://www.cnbc.com/id/100727362/device/rss/rss.html",
+        ],
+        sitemap_urls=[
+            "https://www.cnbc.com/sitemap_news.xml",
+        ]
     ),
     OutletConfig(
         name="NBC News",
@@ -133,7 +194,12 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.byline-name a",
         date_selector="time",
         needs_javascript=True,
-        monthly_visits=91_000_000
+        monthly_visits=91_000_000,
+        feed_urls=[
+            "https://feeds.nbcnews.com/nbcnews/public/news",
+            "https://feeds.nbcnews.com/nbcnews/public/politics",
+            "https://feeds.nbcnews.com/nbcnews/public/world",
+        ]
     ),
     OutletConfig(
         name="CBS News",
@@ -144,7 +210,15 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         body_selector="section.content__body p",
         author_selector="span.byline__name",
         date_selector="time",
-        monthly_visits=103_000_000
+        monthly_visits=103_000_000,
+        feed_urls=[
+            "https://www.cbsnews.com/latest/rss/main",
+            "https://www.cbsnews.com/latest/rss/politics",
+            "https://www.cbsnews.com/latest/rss/world",
+        ],
+        sitemap_urls=[
+            "https://www.cbsnews.com/xml-sitemap/news.xml",
+        ]
     ),
     OutletConfig(
         name="ABC News",
@@ -156,7 +230,12 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.Byline__Author",
         date_selector="div.Byline__Meta--publishDate",
         needs_javascript=True,
-        monthly_visits=85_000_000
+        monthly_visits=85_000_000,
+        feed_urls=[
+            "https://abcnews.go.com/abcnews/topstories",
+            "https://abcnews.go.com/abcnews/politicsheadlines",
+            "https://abcnews.go.com/abcnews/internationalheadlines",
+        ]
     ),
     OutletConfig(
         name="Wall Street Journal",
@@ -168,7 +247,15 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.author",
         date_selector="time.timestamp",
         needs_javascript=True,
-        monthly_visits=80_000_000
+        monthly_visits=80_000_000,
+        feed_urls=[
+            "https://feeds.a.dj.com/rss/RSSWorldNews.xml",
+            "https://feeds.a.dj.com/rss/WSJcomUSBusiness.xml",
+            "https://feeds.a.dj.com/rss/socialpoliticsfeed.xml",
+        ],
+        sitemap_urls=[
+            "https://www.wsj.com/wsjsitemaps/wsj_google_news.xml",
+        ]
     ),
     OutletConfig(
         name="Newsweek",
@@ -179,7 +266,10 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         body_selector="article p",
         author_selector="span.author a",
         date_selector="time",
-        monthly_visits=80_000_000
+        monthly_visits=80_000_000,
+        feed_urls=[
+            "https://www.newsweek.com/rss",
+        ]
     ),
     OutletConfig(
         name="New York Post",
@@ -190,7 +280,15 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         body_selector="div.single__content p",
         author_selector="p.byline a",
         date_selector="span.date",
-        monthly_visits=75_000_000
+        monthly_visits=75_000_000,
+        feed_urls=[
+            "https://nypost.com/news/feed/",
+            "https://nypost.com/us-news/feed/",
+            "https://nypost.com/world-news/feed/",
+        ],
+        sitemap_urls=[
+            "https://nypost.com/news-sitemap.xml",
+        ]
     ),
     OutletConfig(
         name="Yahoo News",
@@ -202,7 +300,10 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.caas-author-byline-collapse",
         date_selector="time",
         needs_javascript=True,
-        monthly_visits=220_000_000
+        monthly_visits=220_000_000,
+        feed_urls=[
+            "https://news.yahoo.com/rss/",
+        ]
     ),
     OutletConfig(
         name="Politico",
@@ -213,7 +314,14 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         body_selector="div.story-text p",
         author_selector="span.byline a",
         date_selector="time.timestamp",
-        monthly_visits=54_000_000
+        monthly_visits=54_000_000,
+        feed_urls=[
+            "https://rss.politico.com/politics-news.xml",
+            "https://rss.politico.com/congress.xml",
+        ],
+        section_urls=[
+            "https://www.politico.com/politics",
+        ]
     ),
     OutletConfig(
         name="The Hill",
@@ -224,7 +332,17 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         body_selector="div.article__text p",
         author_selector="span.submitted-by a",
         date_selector="span.submitted-by-date",
-        monthly_visits=50_000_000
+        monthly_visits=50_000_000,
+        feed_urls=[
+            "https://thehill.com/homenews/feed/",
+            "https://thehill.com/policy/international/feed/",
+        ],
+        section_urls=[
+            "https://thehill.com/homenews/",
+        ],
+        sitemap_urls=[
+            "https://thehill.com/news-sitemap.xml",
+        ]
     ),
     OutletConfig(
         name="HuffPost",
@@ -236,7 +354,15 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="a.author-card__link--author",
         date_selector="time",
         needs_javascript=True,
-        monthly_visits=45_000_000
+        monthly_visits=45_000_000,
+        feed_urls=[
+            "https://www.huffpost.com/section/front-page/feed",
+            "https://www.huffpost.com/section/politics/feed",
+            "https://www.huffpost.com/section/world-news/feed",
+        ],
+        sitemap_urls=[
+            "https://www.huffpost.com/sitemaps/sitemap-google-news.xml",
+        ]
     ),
     OutletConfig(
         name="Business Insider",
@@ -248,7 +374,13 @@ OUTLET_CONFIGS: List[OutletConfig] = [
         author_selector="span.byline-author a",
         date_selector="div.byline-timestamp",
         needs_javascript=True,
-        monthly_visits=40_000_000
+        monthly_visits=40_000_000,
+        feed_urls=[
+            "https://feeds.businessinsider.com/custom/all",
+        ],
+        sitemap_urls=[
+            "https://www.businessinsider.com/sitemap/google-news.xml",
+        ]
     ),
     OutletConfig(
         name="MSN",
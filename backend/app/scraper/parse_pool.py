@@ -0,0 +1,153 @@
+"""
+Parse Executor
+
+Moves CPU-bound work (HTML extraction, classify_article, date parsing)
+off the harvester's event loop. Jobs take raw page bytes plus a picklable
+OutletConfig, so they can run in a process pool. A bounded backlog
+provides backpressure: fetch concurrency is set by the crawl scheduler,
+parse concurrency here.
+
+Celery's prefork children are daemonic, and multiprocessing will not let
+a daemonic process start children, so inside a worker the pool is a
+billiard (Celery's multiprocessing fork) pool, which allows it.
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import billiard
+except ImportError:
+    # Installed with Celery; without it daemonic workers parse on threads
+    billiard = None
+
+from app.scraper.article import ScrapedArticle
+from app.scraper.classifier import classify_article
+from app.scraper.dates import parse_date
+from app.scraper.extractor import get_extractor
+from app.scraper.outlets import OutletConfig
+
+
+# ------------------------------------------------------------
+# Worker entry points (top-level so they pickle)
+# ------------------------------------------------------------
+
+def parse_article_html(
+    html: bytes,
+    config: OutletConfig,
+    url: str,
+    encoding: Optional[str] = None,
+    fetched_at: Optional[datetime] = None
+) -> Optional[ScrapedArticle]:
+    """Extract and classify an article page fetched over HTTP"""
+    article = get_extractor(config).extract(html, url, encoding, fetched_at)
+    if article:
+        article.category_tag = classify_article(article.headline, article.body)
+    return article
+
+
+def parse_search_html(
+    html: bytes,
+    config: OutletConfig,
+    max_articles: int,
+    encoding: Optional[str] = None
+) -> List[str]:
+    """Article URLs from a search results page"""
+    return get_extractor(config).extract_links(html, max_articles, encoding)
+
+
+def build_article(fields: Dict[str, Any], config: OutletConfig, url: str) -> Optional[ScrapedArticle]:
+    """Turn a browser extraction payload into a classified article"""
+    headline = fields["headline"]
+    body = "\n\n".join(fields["body"])
+    if not headline or not body:
+        return None
+
+    return ScrapedArticle(
+        url=url,
+        headline=headline,
+        body=body,
+        author=fields["author"],
+        published_at=parse_date(fields["date"], config.domain),
+        outlet_domain=config.domain,
+        category_tag=classify_article(headline, body)
+    )
+
+
+# ------------------------------------------------------------
+# Executor
+# ------------------------------------------------------------
+
+class ParseExecutor:
+    """
+    Runs parse jobs on an executor with at most `max_pending` queued or
+    running. With no executor, jobs run inline on the event loop.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_pending: int = 32):
+        self.executor = executor
+        self._pending = asyncio.Semaphore(max_pending)
+
+    async def run(self, fn: Callable, *args) -> Any:
+        if self.executor is None:
+            return fn(*args)
+
+        async with self._pending:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, fn, *args)
+
+    def shutdown(self) -> None:
+        """Stop the workers, waiting for them (blocks; call off the event loop)"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+
+class BilliardExecutor(Executor):
+    """concurrent.futures front for a billiard pool, usable from daemonic processes"""
+
+    def __init__(self, max_workers: int):
+        self._pool = billiard.Pool(max_workers)
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self._pool.apply_async(
+            fn, args, kwargs,
+            callback=future.set_result,
+            # billiard passes an ExceptionInfo wrapping the worker's exception
+            error_callback=lambda einfo: future.set_exception(getattr(einfo, "exception", einfo))
+        )
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        if cancel_futures:
+            self._pool.terminate()
+        else:
+            self._pool.close()
+        if wait:
+            self._pool.join()
+
+
+def build_parse_executor(workers: Optional[int] = None, max_pending: int = 32) -> ParseExecutor:
+    """
+    Process pool sized to the machine (or `workers`); 0 runs inline.
+
+    Inside a Celery prefork child (daemonic) the pool comes from billiard.
+    Threads are the last resort: lxml releases the GIL while parsing, but
+    the rest of each job does not, so they barely offload anything.
+    """
+    if workers == 0:
+        return ParseExecutor()
+
+    workers = workers or os.cpu_count() or 1
+    if multiprocessing.current_process().daemon:
+        if billiard is not None:
+            return ParseExecutor(BilliardExecutor(workers), max_pending)
+        print("Parse executor: daemonic worker without billiard, using threads")
+        return ParseExecutor(ThreadPoolExecutor(max_workers=workers), max_pending)
+
+    return ParseExecutor(ProcessPoolExecutor(max_workers=workers), max_pending)
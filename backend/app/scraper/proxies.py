@@ -0,0 +1,214 @@
+"""
+Proxy Sessions
+
+BrightData's super proxy picks a new exit IP per request unless the
+username carries a session id, in which case the exit IP stays put. The
+harvester used one bare proxy URL for everything, so every request to an
+outlet came from a different, randomly good or bad IP.
+
+The ProxyManager keeps a few sticky sessions per outlet and routes each
+request to the one with the best score (smoothed latency, penalised by
+error rate and in-flight requests). A session that turns slow or keeps
+getting blocked is retired and replaced with a fresh one, i.e. a new exit
+IP. Outlets with needs_proxy=False skip the proxy entirely.
+
+Any HTTP proxy works as the upstream, e.g. app.scripts.local_proxy for
+testing: set BRIGHTDATA_HOST=127.0.0.1:8899 and any username/password.
+"""
+import secrets
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# Outcomes that say something about the exit IP rather than the page:
+# blocks, proxy auth/upstream errors and rate limits
+_SESSION_ERROR_STATUSES = {403, 407, 429, 502, 503, 504}
+
+
+def is_session_error(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _SESSION_ERROR_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+@dataclass
+class ProxySession:
+    domain: str
+    session_id: str
+    url: str
+    created_at: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    latency: Optional[float] = None  # smoothed seconds per request
+    retired: bool = False
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def score(self, default_latency: float) -> float:
+        """Lower is better"""
+        latency = self.latency if self.latency is not None else default_latency
+        return latency * (1 + 4 * self.error_rate) * (1 + self.in_flight)
+
+
+@dataclass
+class DomainProxyStats:
+    requests: int = 0
+    errors: int = 0
+    retired: int = 0
+    retire_reasons: Counter = field(default_factory=Counter)
+    latency_total: float = 0.0
+
+
+class ProxyManager:
+    """Sticky, scored proxy sessions per outlet"""
+
+    def __init__(
+        self,
+        username: str = "",
+        password: str = "",
+        host: str = "",
+        session_format: str = "{username}-session-{session}",
+        sessions_per_domain: int = 2,
+        min_requests: int = 5,
+        max_error_rate: float = 0.3,
+        max_latency: float = 8.0,
+        smoothing: float = 0.3
+    ):
+        self.username = username
+        self.password = password
+        self.host = host
+        self.session_format = session_format
+        self.sessions_per_domain = sessions_per_domain
+        self.min_requests = min_requests
+        self.max_error_rate = max_error_rate
+        self.max_latency = max_latency
+        self.smoothing = smoothing
+        self._sessions: Dict[str, List[ProxySession]] = {}
+        self.stats: Dict[str, DomainProxyStats] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.host and self.username and "placeholder" not in self.password)
+
+    def _credentials(self, session_id: str) -> str:
+        return self.session_format.format(username=self.username, session=session_id)
+
+    def _new_session(self, domain: str) -> ProxySession:
+        session_id = secrets.token_hex(6)
+        username = self._credentials(session_id)
+        url = f"http://{username}:{self.password}@{self.host}"
+        return ProxySession(domain=domain, session_id=session_id, url=url)
+
+    def session(self, domain: str, direct: bool = False) -> Optional[ProxySession]:
+        """
+        Proxy session for the next request to `domain`, or None to connect
+        directly. Call begin()/finish() around the request.
+        """
+        if direct or not self.enabled:
+            return None
+
+        sessions = self._sessions.setdefault(domain, [])
+        if len(sessions) < self.sessions_per_domain:
+            session = self._new_session(domain)
+            sessions.append(session)
+            return session
+
+        known = [s.latency for s in sessions if s.latency is not None]
+        default_latency = sum(known) / len(known) if known else 1.0
+        return min(sessions, key=lambda s: s.score(default_latency))
+
+    def begin(self, session: ProxySession) -> None:
+        session.in_flight += 1
+
+    def finish(self, session: ProxySession, elapsed: float, error: bool) -> bool:
+        """
+        Record a request's outcome. Returns True once the session is retired
+        and no request holds it any more, i.e. its client can be closed.
+        """
+        session.in_flight -= 1
+        session.requests += 1
+        stats = self.stats.setdefault(session.domain, DomainProxyStats())
+        stats.requests += 1
+        stats.latency_total += elapsed
+        if error:
+            session.errors += 1
+            stats.errors += 1
+        else:
+            # Errors are often fast refusals; only successes shape latency
+            if session.latency is None:
+                session.latency = elapsed
+            else:
+                session.latency += self.smoothing * (elapsed - session.latency)
+
+        if not session.retired and session.requests >= self.min_requests:
+            if session.error_rate > self.max_error_rate:
+                self._retire(session, "errors")
+            elif session.latency is not None and session.latency > self.max_latency:
+                self._retire(session, "slow")
+        # Requests that picked the session before it was retired still use its client
+        return session.retired and session.in_flight == 0
+
+    def _retire(self, session: ProxySession, reason: str) -> None:
+        session.retired = True
+        sessions = self._sessions.get(session.domain, [])
+        if session in sessions:
+            sessions.remove(session)
+        stats = self.stats.setdefault(session.domain, DomainProxyStats())
+        stats.retired += 1
+        stats.retire_reasons[reason] += 1
+
+    def browser_proxy(self) -> Optional[Dict[str, str]]:
+        """Playwright proxy settings with one sticky session per browser launch"""
+        if not self.enabled:
+            return None
+        return {
+            "server": f"http://{self.host}",
+            "username": self._credentials(f"browser{secrets.token_hex(6)}"),
+            "password": self.password,
+        }
+
+    def reset_stats(self) -> None:
+        """Start a new run's counters; live sessions and their scores are kept"""
+        self.stats.clear()
+
+    def print_summary(self) -> None:
+        if not self.stats:
+            return
+        print("Proxy sessions (requests, errors, avg latency, retired):")
+        for domain, s in sorted(self.stats.items()):
+            avg = s.latency_total / s.requests if s.requests else 0.0
+            reasons = ", ".join(f"{r} {n}" for r, n in sorted(s.retire_reasons.items()))
+            print(
+                f"  {domain:<22} {s.requests:>5} {s.errors:>4} {avg:>6.2f}s "
+                f"{s.retired:>3}" + (f" ({reasons})" if reasons else "")
+            )
+
+
+_manager: Optional[ProxyManager] = None
+
+
+def get_proxy_manager() -> ProxyManager:
+    """Process-wide manager, so good sessions carry over between runs"""
+    global _manager
+    if _manager is None:
+        _manager = ProxyManager(
+            username=settings.brightdata_username,
+            password=settings.brightdata_password,
+            host=settings.brightdata_host,
+            session_format=settings.proxy_session_format,
+            sessions_per_domain=settings.proxy_sessions_per_domain,
+            min_requests=settings.proxy_min_requests,
+            max_error_rate=settings.proxy_max_error_rate,
+            max_latency=settings.proxy_max_latency_seconds,
+        )
+    return _manager
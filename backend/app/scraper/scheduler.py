@@ -0,0 +1,154 @@
+"""
+Crawl Scheduler
+
+Lets the harvester hit every outlet at once while staying polite to each
+one. Every fetch goes through a per-domain token bucket (request rate)
+and in-flight cap, plus a global concurrency cap across all domains.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, bursting up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@dataclass
+class DomainStats:
+    requests: int = 0
+    errors: int = 0
+    wait_seconds: float = 0.0
+    busy_seconds: float = 0.0
+    first_started: Optional[float] = None
+    last_finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.first_started is None or self.last_finished is None:
+            return 0.0
+        return self.last_finished - self.first_started
+
+    @property
+    def throughput(self) -> float:
+        """Requests per minute over the domain's active window"""
+        if not self.elapsed:
+            return 0.0
+        return self.requests / self.elapsed * 60
+
+
+class DomainBudget:
+    """Politeness budget for a single domain"""
+
+    def __init__(self, rate: float, burst: float, max_in_flight: int):
+        self.bucket = TokenBucket(rate, burst)
+        self.in_flight = asyncio.Semaphore(max_in_flight)
+        self.stats = DomainStats()
+
+
+class CrawlScheduler:
+    """Global + per-domain concurrency control for a harvest run"""
+
+    def __init__(
+        self,
+        global_concurrency: int = 16,
+        domain_rate: float = 0.5,
+        domain_burst: float = 2,
+        domain_max_in_flight: int = 2,
+    ):
+        self.global_slots = asyncio.Semaphore(global_concurrency)
+        self.domain_rate = domain_rate
+        self.domain_burst = domain_burst
+        self.domain_max_in_flight = domain_max_in_flight
+        self.budgets: Dict[str, DomainBudget] = {}
+
+    def _budget(self, domain: str) -> DomainBudget:
+        budget = self.budgets.get(domain)
+        if budget is None:
+            budget = DomainBudget(
+                self.domain_rate,
+                self.domain_burst,
+                self.domain_max_in_flight
+            )
+            self.budgets[domain] = budget
+        return budget
+
+    @asynccontextmanager
+    async def slot(self, domain: str):
+        """
+        Wait for permission to make one request to `domain`.
+
+        The domain's in-flight slot is taken before its rate token so a
+        throttled domain never sits on a global slot.
+        """
+        budget = self._budget(domain)
+        stats = budget.stats
+        requested = time.monotonic()
+
+        async with budget.in_flight:
+            await budget.bucket.acquire()
+            async with self.global_slots:
+                started = time.monotonic()
+                stats.wait_seconds += started - requested
+                if stats.first_started is None:
+                    stats.first_started = started
+                try:
+                    yield
+                except Exception:
+                    stats.errors += 1
+                    raise
+                finally:
+                    finished = time.monotonic()
+                    stats.requests += 1
+                    stats.busy_seconds += finished - started
+                    stats.last_finished = finished
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-domain throughput report"""
+        return {
+            domain: {
+                "requests": budget.stats.requests,
+                "errors": budget.stats.errors,
+                "elapsed_s": round(budget.stats.elapsed, 1),
+                "wait_s": round(budget.stats.wait_seconds, 1),
+                "busy_s": round(budget.stats.busy_seconds, 1),
+                "per_minute": round(budget.stats.throughput, 1),
+            }
+            for domain, budget in sorted(self.budgets.items())
+        }
+
+    def print_summary(self) -> None:
+        print("Per-domain throughput:")
+        for domain, row in self.summary().items():
+            print(
+                f"  {domain:<22} {row['requests']:>4} req  "
+                f"{row['per_minute']:>6} req/min  "
+                f"{row['elapsed_s']:>7}s active  "
+                f"{row['wait_s']:>7}s queued  "
+                f"{row['errors']} errors"
+            )
@@ -0,0 +1,201 @@
+"""
+Search Result Cache
+
+An outlet's results for a query like "Supreme Court" barely change within
+a few hours, and the same topics come back day after day (and again on
+every manual harvest_single_outlet run). Search result URL lists are cached
+in Redis, keyed by (domain, normalized query), so repeated searches skip
+the fetch and the Playwright render.
+
+Entries are fresh for `ttl` seconds and then stale for `stale_ttl` more:
+a stale entry is still served immediately while one background search
+refreshes it (stale-while-revalidate). The known-URL filter runs on cached
+lists the same as on live ones, so serving a slightly old list only costs
+already-stored URLs being skipped.
+
+Redis being unavailable degrades to a miss; it never fails a search.
+"""
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Set, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def normalize_query(query: str) -> str:
+    """Case-, punctuation- and whitespace-insensitive form of a query"""
+    return " ".join(_NON_WORD.sub(" ", query.lower()).split())
+
+
+@dataclass
+class SearchCacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    errors: int = 0
+
+
+class SearchResultCache:
+    """Redis-backed TTL cache of search result URL lists"""
+
+    def __init__(
+        self,
+        redis_url: str,
+        ttl: float = 3 * 3600,
+        stale_ttl: float = 21 * 3600,
+        prefix: str = "search-cache"
+    ):
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.prefix = prefix
+        self.stats = SearchCacheStats()
+        self._client = None
+        self._disabled = aioredis is None
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _key(self, domain: str, query: str) -> str:
+        return f"{self.prefix}:{domain}:{normalize_query(query)}"
+
+    def _redis(self):
+        if self._client is None:
+            self._client = aioredis.from_url(self.redis_url, socket_timeout=2)
+        return self._client
+
+    def _error(self, e: Exception) -> None:
+        # One failed round trip turns the cache off for the rest of the run
+        # rather than paying a timeout on every search
+        self.stats.errors += 1
+        self._disabled = True
+        print(f"Search cache unavailable, continuing without it: {e}")
+
+    async def get(
+        self,
+        domain: str,
+        query: str,
+        max_articles: int
+    ) -> Tuple[str, List[str]]:
+        """(FRESH | STALE | MISS, urls) for a search"""
+        if self._disabled:
+            return MISS, []
+        try:
+            raw = await self._redis().get(self._key(domain, query))
+        except Exception as e:
+            self._error(e)
+            return MISS, []
+
+        if raw is None:
+            return MISS, []
+        try:
+            entry = json.loads(raw)
+            urls = [str(url) for url in entry["urls"]]
+            limit, age = int(entry["limit"]), time.time() - float(entry["fetched_at"])
+        except (ValueError, TypeError, KeyError):
+            # Corrupt or foreign entry; the live search overwrites it
+            return MISS, []
+        # A list cut off at a smaller limit can't answer a bigger request
+        if len(urls) < max_articles and limit < max_articles:
+            return MISS, []
+        urls = urls[:max_articles]
+        if age < self.ttl:
+            return FRESH, urls
+        return STALE, urls
+
+    async def set(self, domain: str, query: str, urls: List[str], max_articles: int) -> None:
+        """Store a live result list (empty results are not cached)"""
+        if self._disabled or not urls:
+            return
+        entry = json.dumps({"urls": urls, "limit": max_articles, "fetched_at": time.time()})
+        try:
+            await self._redis().set(
+                self._key(domain, query), entry, ex=int(self.ttl + self.stale_ttl)
+            )
+        except Exception as e:
+            self._error(e)
+
+    async def lookup(
+        self,
+        domain: str,
+        query: str,
+        max_articles: int,
+        search: Callable[[], Awaitable[List[str]]]
+    ) -> List[str]:
+        """
+        Cached results for a search, running `search` on a miss and
+        refreshing in the background when the entry is stale.
+        """
+        state, urls = await self.get(domain, query, max_articles)
+        if state == FRESH:
+            self.stats.hits += 1
+            return urls
+        if state == STALE:
+            self.stats.stale_hits += 1
+            self._revalidate(domain, query, max_articles, search)
+            return urls
+
+        self.stats.misses += 1
+        urls = await search()
+        await self.set(domain, query, urls, max_articles)
+        return urls
+
+    def _revalidate(
+        self,
+        domain: str,
+        query: str,
+        max_articles: int,
+        search: Callable[[], Awaitable[List[str]]]
+    ) -> None:
+        key = self._key(domain, query)
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh():
+            try:
+                urls = await search()
+                await self.set(domain, query, urls, max_articles)
+                self.stats.refreshes += 1
+            except Exception as e:
+                print(f"Search cache refresh failed for {key}: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait for background refreshes still in flight"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        await self.drain()
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception:
+                pass
+            self._client = None
+
+    def print_summary(self) -> None:
+        s = self.stats
+        print(
+            f"Search cache: {s.hits} hits, {s.stale_hits} stale hits "
+            f"({s.refreshes} refreshed), {s.misses} misses"
+            + (f", {s.errors} errors" if s.errors else "")
+        )
@@ -0,0 +1,136 @@
+"""
+Outlet Sweep
+
+Alternative to per-topic site search. Each outlet's RSS feeds and section
+fronts are fetched once per run, and every candidate headline is matched
+locally against all of today's topic keywords, so a run costs a few
+listing pages per outlet instead of one search page per outlet per topic.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from app.scraper.classifier import KeywordAutomaton, tokenize
+from app.scraper.extractor import CompiledExtractor, _text
+from app.scraper.feeds import parse_feed_bytes
+from app.scraper.outlets import OutletConfig
+
+# Anchor text this long on a section front is almost always a headline
+MIN_HEADLINE_WORDS = 5
+
+
+@dataclass
+class SweepCandidate:
+    url: str
+    title: str
+    summary: str = ""
+
+
+def _same_site(url: str, domain: str) -> bool:
+    host = urlparse(url).netloc.lower()
+    return host == domain or host.endswith("." + domain)
+
+
+# ------------------------------------------------------------
+# Listing parsers (top-level so they run in the parse pool)
+# ------------------------------------------------------------
+
+def parse_feed_xml(
+    content: bytes,
+    config: OutletConfig,
+    base_url: str,
+    encoding: Optional[str] = None
+) -> List[SweepCandidate]:
+    """Items of an RSS or Atom feed that link back to the outlet"""
+    return [
+        SweepCandidate(url=urldefrag(item.link)[0], title=item.title, summary=item.description)
+        for item in parse_feed_bytes(content)
+        if item.link and _same_site(item.link, config.domain)
+    ]
+
+
+def parse_section_html(
+    content: bytes,
+    config: OutletConfig,
+    base_url: str,
+    encoding: Optional[str] = None
+) -> List[SweepCandidate]:
+    """Headline links on a section front page"""
+    root = CompiledExtractor.parse(content, encoding)
+    if root is None:
+        return []
+
+    candidates = []
+    for link in root.iter("a"):
+        href = link.get("href")
+        if not href:
+            continue
+        url = urldefrag(urljoin(base_url, href))[0]
+        title = _text(link)
+        if (
+            len(title.split()) >= MIN_HEADLINE_WORDS
+            and _same_site(url, config.domain)
+            and urlparse(url).path.strip("/")
+        ):
+            candidates.append(SweepCandidate(url=url, title=title))
+    return candidates
+
+
+# ------------------------------------------------------------
+# Topic routing
+# ------------------------------------------------------------
+
+class TopicRouter:
+    """
+    Today's topic keywords compiled into one automaton. Each candidate
+    goes to the topic with the most distinct keywords in its headline and
+    summary; ties go to the earlier topic.
+    """
+
+    def __init__(self, topics: Sequence, min_matches: int = 1):
+        self.topic_ids = [str(topic.id) for topic in topics]
+        self.min_matches = min_matches
+
+        phrases = []
+        for topic in topics:
+            keywords = (topic.keywords or {}).get("keywords") or []
+            for phrase in [topic.name, *keywords]:
+                tokens = tokenize(phrase)
+                if tokens:
+                    phrases.append((tokens, (str(topic.id), "keyword", phrase.lower())))
+        self.automaton = KeywordAutomaton(phrases)
+
+    def route(self, candidate: SweepCandidate) -> Optional[str]:
+        """Best matching topic id for a candidate, or None"""
+        matched: Dict[str, set] = defaultdict(set)
+        for topic_id, _, phrase in self.automaton.find(
+            tokenize(f"{candidate.title} {candidate.summary}")
+        ):
+            matched[topic_id].add(phrase)
+
+        best_topic = None
+        best = 0
+        for topic_id in self.topic_ids:
+            score = len(matched.get(topic_id, ()))
+            if score > best:
+                best = score
+                best_topic = topic_id
+        return best_topic if best >= self.min_matches else None
+
+    def route_all(
+        self,
+        candidates: Iterable[SweepCandidate],
+        per_topic: int
+    ) -> Dict[str, List[str]]:
+        """Topic id -> up to `per_topic` candidate URLs, in listing order"""
+        routed: Dict[str, List[str]] = defaultdict(list)
+        seen = set()
+        for candidate in candidates:
+            if candidate.url in seen:
+                continue
+            seen.add(candidate.url)
+            topic_id = self.route(candidate)
+            if topic_id and len(routed[topic_id]) < per_topic:
+                routed[topic_id].append(candidate.url)
+        return dict(routed)
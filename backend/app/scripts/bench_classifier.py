@@ -0,0 +1,63 @@
+"""
+Classifier Benchmark
+
+Times the previous per-keyword substring scan against the compiled
+taxonomy automaton on article bodies of increasing length.
+
+Run with: python -m app.scripts.bench_classifier
+"""
+import random
+import time
+
+from app.scraper.classifier import TaxonomyClassifier
+from app.scraper.taxonomy import TOPIC_CATEGORIES
+
+_FILLER = (
+    "officials said the household budget would reach a billion dollars as "
+    "police and local justice departments reviewed the policy while voters "
+    "waited for the senate and the house to vote on the bill next week"
+).split()
+
+
+def classify_substring(headline: str, body: str):
+    """The previous classify_article implementation"""
+    text = (headline + " " + body).lower()
+    best_category, max_matches = None, 0
+    for category, config in TOPIC_CATEGORIES.items():
+        matches = sum(1 for keyword in config["keywords"] if keyword in text)
+        if matches > max_matches:
+            max_matches, best_category = matches, category
+    return best_category if max_matches >= 2 else None
+
+
+def _body(words: int, seed: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_FILLER) for _ in range(words))
+
+
+def _time(fn, bodies, rounds: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for body in bodies:
+            fn("Lawmakers weigh new measure", body)
+    return (time.perf_counter() - start) / (rounds * len(bodies))
+
+
+def main():
+    classifier = TaxonomyClassifier()
+    for words in (500, 2_000, 10_000, 50_000):
+        bodies = [_body(words, seed) for seed in range(20)]
+        old = _time(classify_substring, bodies)
+        new = _time(classifier.classify, bodies)
+        print(
+            f"{words:>6} words: substring {old * 1000:7.2f} ms  "
+            f"automaton {new * 1000:7.2f} ms  ({old / new:.1f}x)"
+        )
+
+    # Substring matching reads "bill" in "billion" and "house" in "household"
+    headline = "Household spending tops a billion as police budgets grow"
+    print(f"Substring scan category: {classify_substring(headline, 'The senate was not involved.')}")
+    print(f"Automaton category:      {classifier.classify(headline, 'The senate was not involved.').category}")
+
+if __name__ == "__main__":
+    main()
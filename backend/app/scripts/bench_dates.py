@@ -0,0 +1,61 @@
+"""
+Date Parsing Benchmark
+
+Times dateutil against DateNormalizer on the date strings found in the
+fixture pages, and reports strings the two disagree on.
+
+Run with: python -m app.scripts.bench_dates [saved_pages_dir]
+"""
+import sys
+import time
+import warnings
+from datetime import datetime
+
+from dateutil import parser
+
+from app.scraper.dates import DateNormalizer, _to_naive_utc
+from app.scraper.extractor import get_extractor
+from app.scripts.bench_fixtures import load_corpus
+
+
+def main(directory: str = None, rounds: int = 200):
+    samples = []
+    for config, _, html in load_corpus(directory, pages_per_outlet=20):
+        extractor = get_extractor(config)
+        date_str = extractor.extract_fields(extractor.parse(html))["date"]
+        if date_str:
+            samples.append((config.domain, date_str))
+    print(f"{len(samples)} date strings from fixture pages")
+
+    warnings.simplefilter("ignore")  # dateutil warns on ET/EST
+
+    def with_dateutil(text):
+        try:
+            return _to_naive_utc(parser.parse(text))
+        except (ValueError, OverflowError):
+            return None
+
+    normalizer = DateNormalizer()
+    fetched_at = datetime.utcnow()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for _, text in samples:
+            with_dateutil(text)
+    old = (time.perf_counter() - start) / (rounds * len(samples))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for domain, text in samples:
+            normalizer.parse(text, domain, fetched_at)
+    new = (time.perf_counter() - start) / (rounds * len(samples))
+
+    parsed_old = sum(1 for _, t in samples if with_dateutil(t))
+    parsed_new = sum(1 for d, t in samples if normalizer.parse(t, d, fetched_at))
+    print(f"dateutil:       {old * 1e6:7.1f} us/date  ({parsed_old}/{len(samples)} parsed)")
+    print(f"DateNormalizer: {new * 1e6:7.1f} us/date  ({parsed_new}/{len(samples)} parsed)")
+    print(f"Speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
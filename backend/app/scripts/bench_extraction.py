@@ -0,0 +1,73 @@
+"""
+Extraction Benchmark
+
+Times the old BeautifulSoup extraction against the compiled lxml
+extractor on the fixture corpus, and checks both agree on the headline
+and paragraph count.
+
+Run with: python -m app.scripts.bench_extraction [saved_pages_dir]
+"""
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+from app.scraper.extractor import get_extractor
+from app.scripts.bench_fixtures import load_corpus
+
+
+def extract_with_soup(html: bytes, config):
+    """The previous httpx-path extraction (decode, soup, select)"""
+    soup = BeautifulSoup(html.decode("utf-8", errors="replace"), "lxml")
+    headline_el = soup.select_one(config.headline_selector)
+    headline = headline_el.get_text(" ", strip=True) if headline_el else ""
+    paragraphs = [p.get_text(" ", strip=True) for p in soup.select(config.body_selector)]
+    author = None
+    if config.author_selector:
+        author_el = soup.select_one(config.author_selector)
+        author = author_el.get_text(strip=True) if author_el else None
+    date_str = None
+    if config.date_selector:
+        date_el = soup.select_one(config.date_selector)
+        if date_el:
+            date_str = date_el.get("datetime") or date_el.get_text(strip=True)
+    return headline, paragraphs, author, date_str
+
+
+def main(directory: str = None, rounds: int = 3):
+    corpus = load_corpus(directory)
+    if not corpus:
+        print("No fixture pages found")
+        return
+    total_mb = sum(len(html) for _, _, html in corpus) / 1e6
+    print(f"{len(corpus)} pages, {total_mb:.1f} MB")
+
+    # Agreement check
+    mismatches = 0
+    for config, url, html in corpus:
+        headline, paragraphs, _, _ = extract_with_soup(html, config)
+        article = get_extractor(config).extract(html, url)
+        if not article or " ".join(headline.split()) != article.headline or \
+                len([p for p in paragraphs if p]) != len(article.body.split("\n\n")):
+            mismatches += 1
+    print(f"Mismatched pages: {mismatches}")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for config, _, html in corpus:
+            extract_with_soup(html, config)
+    soup_time = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for config, url, html in corpus:
+            get_extractor(config).extract(html, url)
+    lxml_time = (time.perf_counter() - start) / rounds
+
+    print(f"BeautifulSoup: {soup_time * 1000 / len(corpus):6.2f} ms/page")
+    print(f"Compiled lxml: {lxml_time * 1000 / len(corpus):6.2f} ms/page")
+    print(f"Speedup: {soup_time / lxml_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,83 @@
+"""
+HTTP Pool Benchmark
+
+Compares the old one-client-per-request pattern against the pooled
+keep-alive clients used by ArticleScraper, against a local HTTP stand-in
+(no network, no proxy).
+
+Run with: python -m app.scripts.bench_http_pool [requests] [concurrency]
+"""
+import asyncio
+import sys
+import time
+
+import httpx
+
+from app.scraper.http_pool import HttpClientPool
+
+PAGE = b"<html><body><h1>Headline</h1>" + b"<p>Paragraph text.</p>" * 200 + b"</body></html>"
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP/1.1 keep-alive responder"""
+    try:
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            if not request:
+                break
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/html\r\n"
+                b"Content-Length: " + str(len(PAGE)).encode() + b"\r\n"
+                b"Connection: keep-alive\r\n\r\n" + PAGE
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _run(label: str, fetch, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await fetch()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed
+    print(f"{label:<28} {total} requests in {elapsed:.2f}s -> {rate:,.0f} req/s")
+    return rate
+
+
+async def main(total: int = 2000, concurrency: int = 6):
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/article"
+
+    async with server:
+        async def per_request_client():
+            async with httpx.AsyncClient(timeout=30) as client:
+                response = await client.get(url)
+                response.raise_for_status()
+
+        pool = HttpClientPool(max_connections_per_host=concurrency)
+
+        async def pooled_client():
+            client = await pool.get("127.0.0.1")
+            response = await client.get(url)
+            response.raise_for_status()
+
+        baseline = await _run("client per request", per_request_client, total, concurrency)
+        pooled = await _run("pooled keep-alive client", pooled_client, total, concurrency)
+        await pool.close()
+
+    print(f"Speedup: {pooled / baseline:.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    asyncio.run(main(*args))
@@ -0,0 +1,105 @@
+"""
+Entity Extraction Benchmark
+
+Times the previous per-item nlp(text) calls through the full pipeline
+against extract_entities_batch (nlp.pipe, NER-only) on synthetic wire
+feed items. Uses en_core_web_sm when installed; otherwise an untrained
+pipeline with the same components (tok2vec, tagger, parser, ner), which
+costs the same to run but finds no real entities.
+
+Run with: python -m app.scripts.bench_ner [items] [n_process]
+"""
+import random
+import sys
+import time
+from typing import Callable, List
+
+import spacy
+
+from app.scraper.discovery import NER_LABELS, extract_entities_batch
+from app.scraper.nlp import ner_only, set_nlp
+
+_PEOPLE = ["Joe Biden", "Donald Trump", "Vladimir Putin", "Xi Jinping", "Jerome Powell", "Emmanuel Macron"]
+_ORGS = ["the Senate", "NATO", "the Federal Reserve", "the Supreme Court", "Hamas", "the United Nations"]
+_PLACES = ["Ukraine", "Gaza", "Taiwan", "Texas", "Brussels", "Beijing", "Arizona"]
+_TITLES = [
+    "{person} meets {org} leaders over {place} crisis",
+    "{org} votes on {place} aid package as {person} pushes deal",
+    "{person} says {place} talks with {org} are at a turning point",
+    "Markets slide after {org} signals pause; {person} responds",
+]
+_DESCRIPTIONS = [
+    "{person} told reporters in {place} on Tuesday that {org} would act within days.",
+    "Officials from {org} and {place} met for a third day as {person} weighed sanctions.",
+    "The decision by {org} drew criticism from {person}, who visited {place} last week.",
+]
+
+
+def feed_items(count: int, seed: int = 0) -> List[str]:
+    """'title description' strings shaped like AP/Reuters feed items"""
+    rng = random.Random(seed)
+
+    def fill(template: str) -> str:
+        return template.format(
+            person=rng.choice(_PEOPLE), org=rng.choice(_ORGS), place=rng.choice(_PLACES)
+        )
+
+    return [
+        f"{fill(rng.choice(_TITLES))} {fill(rng.choice(_DESCRIPTIONS))}"
+        for _ in range(count)
+    ]
+
+
+def load_pipeline():
+    try:
+        return spacy.load("en_core_web_sm"), "en_core_web_sm"
+    except OSError:
+        nlp = spacy.blank("en")
+        nlp.add_pipe("tok2vec")
+        nlp.add_pipe("tagger").add_label("NN")
+        nlp.add_pipe("parser").add_label("nsubj")
+        nlp.add_pipe("ner").add_label("PERSON")
+        nlp.initialize()
+        return nlp, "untrained tok2vec/tagger/parser/ner (en_core_web_sm not installed)"
+
+
+def per_item(nlp) -> Callable[[List[str]], List[List[str]]]:
+    """The previous extract_entities, called once per feed item"""
+    def run(texts: List[str]) -> List[List[str]]:
+        return [
+            [ent.text for ent in nlp(text).ents if ent.label_ in NER_LABELS]
+            for text in texts
+        ]
+    return run
+
+
+def _time(fn, texts: List[str]) -> float:
+    fn(texts[:50])  # warm up
+    start = time.perf_counter()
+    fn(texts)
+    return len(texts) / (time.perf_counter() - start)
+
+
+def main(items: int = 3000, n_process: int = 1):
+    texts = feed_items(items)
+
+    full, name = load_pipeline()
+    print(f"Pipeline: {name}")
+    print(f"Components: {', '.join(full.pipe_names)}")
+    baseline = _time(per_item(full), texts)
+    print(f"nlp(text) per item, full pipeline   {baseline:8,.0f} items/s")
+
+    trimmed = ner_only(load_pipeline()[0])
+    set_nlp(trimmed)
+    print(f"Enabled for batching: {', '.join(trimmed.pipe_names)}")
+    for processes in sorted({1, n_process}):
+        rate = _time(lambda t: extract_entities_batch(t, n_process=processes), texts)
+        print(
+            f"nlp.pipe, NER only, n_process={processes:<3} {rate:8,.0f} items/s "
+            f"({rate / baseline:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
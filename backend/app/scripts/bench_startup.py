@@ -0,0 +1,78 @@
+"""
+Startup Benchmark
+
+Measures, in fresh interpreters, what importing the discovery module
+costs now that the spaCy model loads lazily, against the previous
+import-time load (import + get_nlp()), plus how long the first entity
+extraction waits with and without warm_up().
+
+Run with: python -m app.scripts.bench_startup [--runs 5] [--model en_core_web_sm or a pipeline dir]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Each snippet prints {"seconds": ..., "rss_mb": ...} for the measured step
+_PRELUDE = """
+import json, resource, sys, time
+import app.scraper.nlp as nlp_provider
+nlp_provider.MODEL_NAME = sys.argv[1]
+started = time.perf_counter()
+"""
+_REPORT = """
+elapsed = time.perf_counter() - started
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({"seconds": elapsed, "rss_mb": rss, "model": nlp_provider.get_nlp() is not None}))
+"""
+
+CASES = {
+    "import discovery (lazy)": """
+import app.scraper.discovery
+""",
+    "import discovery + load (previous)": """
+import app.scraper.discovery
+nlp_provider.get_nlp()
+""",
+    "import + first extraction, cold": """
+from app.scraper.discovery import extract_entities
+extract_entities("Senate leaders met in Washington on Tuesday.")
+""",
+    "first extraction after warm_up": """
+from app.scraper.discovery import extract_entities
+nlp_provider.warm_up()
+started = time.perf_counter()
+extract_entities("Senate leaders met in Washington on Tuesday.")
+""",
+}
+
+
+def run_case(code: str, model: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _PRELUDE + code + _REPORT, model],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--model", default="en_core_web_sm")
+    args = parser.parse_args()
+
+    print(f"Model: {args.model}, median of {args.runs} fresh interpreters")
+    loaded = None
+    for label, code in CASES.items():
+        results = [run_case(code, args.model) for _ in range(args.runs)]
+        seconds = statistics.median(r["seconds"] for r in results)
+        rss = statistics.median(r["rss_mb"] for r in results)
+        loaded = results[-1]["model"]
+        print(f"  {label:<36} {seconds * 1000:8.0f} ms  {rss:6.0f} MB peak RSS")
+    if not loaded:
+        print("  (model not installed: timings cover importing spaCy only)")
+
+
+if __name__ == "__main__":
+    main()
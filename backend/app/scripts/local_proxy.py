@@ -0,0 +1,263 @@
+"""
+Local Proxy Stand-in
+
+A small HTTP forward proxy (CONNECT tunnels and plain absolute-URI
+requests) that plays BrightData for local testing. It reads the session
+id out of the Proxy-Authorization username and can make some sessions
+behave like bad exit IPs, being slow and returning 502s.
+
+Point the harvester at it with BRIGHTDATA_HOST=127.0.0.1:8899 and any
+BRIGHTDATA_USERNAME/BRIGHTDATA_PASSWORD, or run the self-contained demo
+that drives a ProxyManager against a local origin:
+
+Run with:
+    python -m app.scripts.local_proxy [--port 8899] [--bad-sessions 0.3]
+    python -m app.scripts.local_proxy --demo [--requests 300]
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import random
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+import httpx
+
+from app.scraper.http_pool import HttpClientPool
+from app.scraper.proxies import ProxyManager, is_session_error
+
+
+class ProxyStandIn:
+    """Forward proxy with per-session fault injection"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bad_sessions: float = 0.0,
+        bad_latency: float = 0.5,
+        bad_error_rate: float = 0.5
+    ):
+        self.latency = latency
+        self.bad_sessions = bad_sessions
+        self.bad_latency = bad_latency
+        self.bad_error_rate = bad_error_rate
+        self.requests: Counter = Counter()
+        self.failed: Counter = Counter()
+
+    def _session(self, head: bytes) -> str:
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() != b"proxy-authorization":
+                continue
+            scheme, _, token = value.strip().partition(b" ")
+            if scheme.lower() != b"basic":
+                break
+            username = base64.b64decode(token).decode(errors="replace").partition(":")[0]
+            return username.rpartition("-session-")[2] if "-session-" in username else "-"
+        return "-"
+
+    def _is_bad(self, session: str) -> bool:
+        # Stable per session, like an exit IP that is simply bad
+        digest = hashlib.sha256(session.encode()).digest()
+        return digest[0] / 256 < self.bad_sessions
+
+    async def _fault(self, session: str) -> bool:
+        """Apply injected latency; True if this request should fail"""
+        bad = self._is_bad(session)
+        delay = self.latency + (self.bad_latency if bad else 0.0)
+        if delay:
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+        return bad and random.random() < self.bad_error_rate
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                method, target, _ = head.split(b"\r\n", 1)[0].split(b" ", 2)
+                session = self._session(head)
+                self.requests[session] += 1
+
+                if await self._fault(session):
+                    self.failed[session] += 1
+                    writer.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\n\r\n")
+                    await writer.drain()
+                    continue
+
+                if method == b"CONNECT":
+                    await self._tunnel(target.decode(), reader, writer)
+                    return
+                await self._forward(method, target.decode(), head, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _tunnel(self, target: str, reader, writer) -> None:
+        host, _, port = target.rpartition(":")
+        up_reader, up_writer = await asyncio.open_connection(host, int(port))
+        writer.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+        await writer.drain()
+
+        async def pipe(src, dst):
+            try:
+                while data := await src.read(65536):
+                    dst.write(data)
+                    await dst.drain()
+            except ConnectionError:
+                pass
+            finally:
+                dst.close()
+
+        await asyncio.gather(pipe(reader, up_writer), pipe(up_reader, writer))
+
+    async def _forward(self, method: bytes, target: str, head: bytes, reader, writer) -> None:
+        url = httpx.URL(target)
+        headers = [
+            line for line in head.split(b"\r\n")[1:]
+            if line and line.split(b":", 1)[0].strip().lower() not in (
+                b"proxy-authorization", b"proxy-connection", b"connection", b"keep-alive"
+            )
+        ]
+        length = next(
+            (int(h.split(b":", 1)[1]) for h in headers if h.lower().startswith(b"content-length:")), 0
+        )
+        body = await reader.readexactly(length) if length else b""
+
+        # HTTP/1.0 upstream: no chunking, body ends at close
+        up_reader, up_writer = await asyncio.open_connection(url.host, url.port or 80)
+        path = url.raw_path.decode() or "/"
+        up_writer.write(
+            method + b" " + path.encode() + b" HTTP/1.0\r\n"
+            + b"\r\n".join(headers) + b"\r\nConnection: close\r\n\r\n" + body
+        )
+        await up_writer.drain()
+        response = await up_reader.read()
+        up_writer.close()
+
+        status_head, _, content = response.partition(b"\r\n\r\n")
+        lines = status_head.split(b"\r\n")
+        kept = [
+            line for line in lines[1:]
+            if line.split(b":", 1)[0].strip().lower() not in (
+                b"content-length", b"transfer-encoding", b"connection"
+            )
+        ]
+        writer.write(
+            lines[0] + b"\r\n" + b"".join(line + b"\r\n" for line in kept)
+            + b"Content-Length: " + str(len(content)).encode() + b"\r\n\r\n" + content
+        )
+        await writer.drain()
+
+    def print_summary(self) -> None:
+        print(f"{len(self.requests)} sessions, {sum(self.requests.values())} requests:")
+        for session, n in self.requests.most_common():
+            bad = " (bad exit)" if self._is_bad(session) else ""
+            print(f"  {session:<28} {n:>5} requests {self.failed[session]:>4} failed{bad}")
+
+
+async def _origin(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Local 'news site' for the demo"""
+    page = b"<html><body><h1>Headline</h1>" + b"<p>Paragraph.</p>" * 100 + b"</body></html>"
+    try:
+        await reader.readuntil(b"\r\n\r\n")
+        await asyncio.sleep(random.uniform(0.01, 0.03))
+        writer.write(
+            b"HTTP/1.0 200 OK\r\nContent-Type: text/html\r\n"
+            b"Content-Length: " + str(len(page)).encode() + b"\r\n\r\n" + page
+        )
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _start(proxy: ProxyStandIn, port: int) -> Tuple[asyncio.AbstractServer, int]:
+    server = await asyncio.start_server(proxy.handle, "127.0.0.1", port)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def demo(proxy: ProxyStandIn, total: int, concurrency: int = 6) -> None:
+    """Drive a ProxyManager through the stand-in and show sessions being retired"""
+    proxy_server, proxy_port = await _start(proxy, 0)
+    origin = await asyncio.start_server(_origin, "127.0.0.1", 0)
+    url = f"http://127.0.0.1:{origin.sockets[0].getsockname()[1]}/article"
+
+    manager = ProxyManager(
+        username="brd-customer-demo-zone-news",
+        password="secret",
+        host=f"127.0.0.1:{proxy_port}",
+        max_latency=0.3,
+    )
+    pool = HttpClientPool(max_connections_per_host=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            # Two domains so sessions are tracked separately
+            domain = "cnn.com" if i % 2 else "apnews.com"
+            session = manager.session(domain)
+            manager.begin(session)
+            client = await pool.get(domain, session.url)
+            started = time.monotonic()
+            error = False
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+            except Exception as e:
+                error = is_session_error(e)
+            elapsed = time.monotonic() - started
+            latencies.append((i, elapsed, error))
+            if manager.finish(session, elapsed, error):
+                await pool.discard(domain, session.url)
+
+    async with proxy_server, origin:
+        await asyncio.gather(*(one(i) for i in range(total)))
+    await pool.close()
+
+    def describe(rows):
+        times = sorted(t for _, t, _ in rows)
+        errors = sum(1 for *_, e in rows if e)
+        return f"p50 {times[len(times) // 2] * 1000:.0f}ms, p95 {times[int(len(times) * 0.95)] * 1000:.0f}ms, {errors} errors"
+
+    latencies.sort()
+    half = len(latencies) // 2
+    proxy.print_summary()
+    manager.print_summary()
+    print(f"First half:  {describe(latencies[:half])}")
+    print(f"Second half: {describe(latencies[half:])}")
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--latency", type=float, default=0.0, help="added seconds per request")
+    parser.add_argument("--bad-sessions", type=float, default=0.0, help="fraction of sessions that act as bad exits")
+    parser.add_argument("--demo", action="store_true")
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    if args.demo:
+        proxy = ProxyStandIn(latency=args.latency, bad_sessions=args.bad_sessions or 0.4)
+        asyncio.run(demo(proxy, args.requests))
+        return
+
+    proxy = ProxyStandIn(latency=args.latency, bad_sessions=args.bad_sessions)
+
+    async def serve():
+        server, port = await _start(proxy, args.port)
+        print(f"Proxy stand-in listening on 127.0.0.1:{port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        proxy.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Article Ingest Sink
+
+Buffers scraped articles during a harvest run and writes them in bulk:
+one multi-row INSERT ... ON CONFLICT (url) DO NOTHING per batch, plus a
+single UPDATE that adds each topic's new-article count in place. Articles
+that already exist are skipped by the database, so there is no per-URL
+SELECT, and counters are incremented atomically instead of read and
+written back.
+
+Rows leave the buffer only once their batch commits. A batch rejected
+for its data (a value too long for its column, say) is retried row by
+row, so one bad article does not take the rest of the batch with it.
+"""
+import asyncio
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from typing import List
+
+from sqlalchemy import Integer, column, update, values
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.db.database import AsyncSessionLocal
+from app.db.models import Article, Topic
+from app.scraper.article import ScrapedArticle
+
+
+@dataclass
+class IngestStats:
+    queued: int = 0
+    inserted: int = 0
+    duplicates: int = 0  # rows skipped by ON CONFLICT
+    rejected: int = 0  # rows the database refused on their own
+    flushes: int = 0
+
+
+def clip(value, length: int):
+    """Truncate a string to a column's length (None passes through)"""
+    return value[:length] if value else value
+
+
+class ArticleIngestSink:
+    """Batched article writer shared by every outlet in a harvest run"""
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = batch_size
+        self.stats = IngestStats()
+        self._buffer: List[dict] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Articles added but not yet committed"""
+        return len(self._buffer)
+
+    async def add(self, scraped: ScrapedArticle, outlet_id: str, topic_id: str) -> None:
+        """Queue an article, flushing once a full batch is buffered"""
+        self._buffer.append({
+            "outlet_id": uuid.UUID(str(outlet_id)),
+            "topic_id": uuid.UUID(str(topic_id)),
+            "headline": scraped.headline,
+            "body": scraped.body,
+            "url": scraped.url,
+            # Joined JSON-LD author lists can outgrow the column
+            "author": clip(scraped.author, Article.author.type.length),
+            "published_at": scraped.published_at,
+            "category_tag": clip(scraped.category_tag, Article.category_tag.type.length),
+        })
+        self.stats.queued += 1
+        if len(self._buffer) >= self.batch_size:
+            try:
+                await self.flush()
+            except Exception as e:
+                # The batch stays buffered for the next flush; the article
+                # that happened to fill it is not at fault
+                print(f"Ingest flush failed, keeping {len(self._buffer)} articles: {e}")
+
+    async def flush(self) -> int:
+        """Write everything buffered; returns the number of new articles"""
+        async with self._lock:
+            if not self._buffer:
+                return 0
+            # Articles added while this batch is written wait for the next one
+            pending = len(self._buffer)
+            # One row per URL; a repeat in the same batch would be dropped
+            # by the constraint anyway
+            rows = list({row["url"]: row for row in self._buffer[:pending]}.values())
+
+            rejected = 0
+            try:
+                inserted = await self._write(rows)
+            except (DataError, IntegrityError) as e:
+                print(f"Ingest batch rejected ({type(e).__name__}), retrying row by row")
+                inserted = 0
+                for row in rows:
+                    try:
+                        inserted += await self._write([row])
+                    except (DataError, IntegrityError) as row_error:
+                        rejected += 1
+                        print(f"Ingest rejected {row['url']}: {row_error.orig}")
+            # Anything else (database unreachable) propagates and keeps the buffer
+            del self._buffer[:pending]
+
+            self.stats.flushes += 1
+            self.stats.inserted += inserted
+            self.stats.rejected += rejected
+            self.stats.duplicates += len(rows) - inserted - rejected
+            return inserted
+
+    async def _write(self, rows: List[dict]) -> int:
+        """Insert one batch and bump its topics' counters in one transaction"""
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                insert(Article)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["url"])
+                .returning(Article.topic_id)
+            )
+            inserted = result.all()
+
+            per_topic = Counter(topic_id for (topic_id,) in inserted)
+            if per_topic:
+                increments = values(
+                    column("id", UUID(as_uuid=True)),
+                    column("n", Integer),
+                    name="increments"
+                ).data(list(per_topic.items()))
+                await db.execute(
+                    update(Topic)
+                    .where(Topic.id == increments.c.id)
+                    .values(article_count=Topic.article_count + increments.c.n)
+                )
+            await db.commit()
+        return len(inserted)
+
+    def print_summary(self) -> None:
+        print(
+            f"Ingest: {self.stats.inserted}/{self.stats.queued} articles inserted "
+            f"({self.stats.duplicates} already stored, {self.stats.rejected} rejected) "
+            f"in {self.stats.flushes} batched writes"
+        )
@@ -0,0 +1,91 @@
+"""
+Known-URL Index
+
+Lets the harvester drop URLs we already stored right after the search
+step, before paying for a fetch, parse and classification. Recent URLs
+are loaded once per harvest run; anything older is checked in one batched
+query per search result list.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, List, Set
+
+from sqlalchemy import select
+
+from app.db.database import AsyncSessionLocal
+from app.db.models import Article
+
+
+@dataclass
+class KnownUrlStats:
+    checked: int = 0
+    skipped_stored: int = 0  # already in the articles table
+    skipped_in_run: int = 0  # already claimed by another topic this run
+    db_lookups: int = 0
+
+
+class KnownUrlIndex:
+    """In-memory set of stored article URLs for one harvest run"""
+
+    def __init__(self, window_days: int = 30):
+        self.window_days = window_days
+        self.stats = KnownUrlStats()
+        self._stored: Set[str] = set()
+        self._claimed: Set[str] = set()
+
+    async def load(self) -> "KnownUrlIndex":
+        """Preload URLs scraped within the window"""
+        since = datetime.utcnow() - timedelta(days=self.window_days)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Article.url).where(Article.scraped_at >= since)
+            )
+            self._stored = set(result.scalars().all())
+        return self
+
+    def __len__(self) -> int:
+        return len(self._stored)
+
+    async def _lookup(self, urls: List[str]) -> Set[str]:
+        """Batched check for stored URLs older than the preload window"""
+        self.stats.db_lookups += 1
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Article.url).where(Article.url.in_(urls))
+            )
+            return set(result.scalars().all())
+
+    async def filter_new(self, urls: Iterable[str]) -> List[str]:
+        """
+        Return URLs that still need fetching, in their original order.
+
+        Returned URLs are claimed for this run, so a second topic that
+        finds the same article will not fetch it again.
+        """
+        candidates = []
+        for url in dict.fromkeys(urls):
+            self.stats.checked += 1
+            if url in self._stored:
+                self.stats.skipped_stored += 1
+            elif url in self._claimed:
+                self.stats.skipped_in_run += 1
+            else:
+                candidates.append(url)
+
+        if candidates:
+            older = await self._lookup(candidates)
+            self._stored.update(older)
+            self.stats.skipped_stored += len(older)
+            candidates = [url for url in candidates if url not in older]
+
+        self._claimed.update(candidates)
+        return candidates
+
+    def print_summary(self) -> None:
+        skipped = self.stats.skipped_stored + self.stats.skipped_in_run
+        print(
+            f"Known-URL filter: skipped {skipped}/{self.stats.checked} fetches "
+            f"({self.stats.skipped_stored} already stored, "
+            f"{self.stats.skipped_in_run} repeated across topics, "
+            f"{self.stats.db_lookups} batched lookups)"
+        )
@@ -0,0 +1,44 @@
+"""
+Sitemap Cursors
+
+Per-outlet high-water marks for the news sitemap crawler, so each run
+only routes entries that are new or changed since the last one.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.database import AsyncSessionLocal
+from app.db.models import SitemapCursor
+
+
+async def load_cursors() -> Dict[str, Optional[datetime]]:
+    """Domain -> newest lastmod processed"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(SitemapCursor))
+        return {cursor.domain: cursor.high_water_mark for cursor in result.scalars().all()}
+
+
+async def save_cursor(domain: str, high_water_mark: Optional[datetime]) -> None:
+    """Advance an outlet's mark (never moves it backwards)"""
+    if high_water_mark is None:
+        return
+    stmt = insert(SitemapCursor).values(
+        domain=domain,
+        high_water_mark=high_water_mark,
+        updated_at=datetime.utcnow()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["domain"],
+        set_={
+            "high_water_mark": high_water_mark,
+            "updated_at": datetime.utcnow(),
+        },
+        where=(SitemapCursor.high_water_mark.is_(None))
+        | (SitemapCursor.high_water_mark < high_water_mark)
+    )
+    async with AsyncSessionLocal() as db:
+        await db.execute(stmt)
+        await db.commit()
@@ -8,6 +8,11 @@ from app.config import get_settings
 
 settings = get_settings()
 
+# Discovery runs on its own queue so only those workers load the spaCy
+# model (see app.tasks.discovery). Deployments need a worker started with
+# -Q discovery (or -Q celery,discovery); see the README.
+DISCOVERY_QUEUE = "discovery"
+
 celery_app = Celery(
     "yellow",
     broker=settings.redis_url,
@@ -31,6 +36,7 @@ celery_app.conf.update(
     task_time_limit=3600,  # 1 hour max
     worker_prefetch_multiplier=1,
     worker_concurrency=4,
+    task_routes={"app.tasks.discovery.*": {"queue": DISCOVERY_QUEUE}},
 )
 
 # Scheduled tasks (cron jobs)
@@ -47,6 +53,12 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(hour=7, minute=0),
     },
     
+    # Incremental News Sitemap Crawl - every 30 minutes
+    "harvest-sitemaps": {
+        "task": "app.tasks.scraping.harvest_sitemaps",
+        "schedule": crontab(minute="*/30"),
+    },
+    
     # Scoring Pipeline - 9:00 AM UTC daily
     "score-articles-daily": {
         "task": "app.tasks.scoring.score_pending_articles",
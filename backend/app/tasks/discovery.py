@@ -4,14 +4,38 @@ Topic Discovery Tasks
 import asyncio
 from datetime import datetime
 from celery import shared_task
+from celery.signals import celeryd_after_setup, worker_process_init
 
-from app.tasks.celery_app import celery_app
+from app.tasks.celery_app import celery_app, DISCOVERY_QUEUE
 from app.scraper.discovery import discover_daily_topics, DiscoveredTopic
+from app.scraper.nlp import warm_up
 from app.db.database import AsyncSessionLocal
 from app.db.models import Topic
 from app.services.firestore_sync import sync_topic_to_firestore
 
 
+_warm_nlp = False
+
+
+@celeryd_after_setup.connect
+def _note_discovery_worker(sender, instance, **kwargs):
+    """Remember, before the pool forks, whether this worker serves discovery"""
+    global _warm_nlp
+    _warm_nlp = DISCOVERY_QUEUE in instance.app.amqp.queues.consume_from
+
+
+@worker_process_init.connect
+def _warm_up_nlp(**kwargs):
+    """Load the spaCy model in each discovery worker process before its first task"""
+    if not _warm_nlp:
+        return
+    elapsed = warm_up()
+    if elapsed is None:
+        print("spaCy model not installed; discovery will use keyword fallback")
+    else:
+        print(f"spaCy model warmed up in {elapsed:.2f}s")
+
+
 async def _store_topics(topics: list[DiscoveredTopic]) -> int:
     """Store discovered topics in database"""
     async with AsyncSessionLocal() as db:
@@ -12,6 +12,7 @@ from app.services.redraft import generate_redraft, redraft_to_json
 from app.services.vectordb import store_article, query_historical_context, format_context_for_scoring
 from app.db.database import AsyncSessionLocal
 from app.db.models import Article, Outlet, ScoringAudit
+from app.scraper.classifier import get_classifier
 from app.services.skew import SkewCalculator
 from app.services.firestore_sync import sync_article_to_firestore, sync_outlet_to_firestore
 
@@ -66,6 +67,10 @@ async def _score_single_article(article_id: str) -> bool:
             historical_context=context_str
         )
         
+        # Backfill the taxonomy tag (used for topic skew) if harvesting didn't set one
+        if not article.category_tag:
+            article.category_tag = get_classifier().classify(article.headline, article.body).category
+        
         # Update article with score
         article.score = result.final_score
         article.violations = violations_to_json(result.violations)
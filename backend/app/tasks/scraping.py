@@ -2,16 +2,102 @@
 Article Scraping Tasks
 """
 import asyncio
+import time
 from datetime import datetime, date
 from celery import shared_task
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
 from app.tasks.celery_app import celery_app
-from app.scraper.harvester import scrape_topic_from_outlet, ScrapedArticle
-from app.scraper.outlets import get_scored_outlets, OutletConfig
+from app.scraper.harvester import ArticleScraper, scrape_article_urls, scrape_topic_from_outlet
+from app.scraper.archive import PageArchive
+from app.scraper.browser_pool import close_browser_pools
+from app.scraper.fetch_mode import get_fetch_mode_selector
+from app.scraper.frontier import ARTICLE, SEARCH, SWEEP, FrontierItem, FrontierLease, RedisFrontier
+from app.scraper.outlets import get_outlet_config, get_scored_outlets, OutletConfig
+from app.scraper.parse_pool import build_parse_executor
+from app.scraper.proxies import get_proxy_manager
+from app.scraper.scheduler import CrawlScheduler
+from app.scraper.search_cache import SearchResultCache
+from app.scraper.sweep import SweepCandidate, TopicRouter
+from app.services.ingest import ArticleIngestSink
+from app.services.known_urls import KnownUrlIndex
+from app.services.sitemap_cursors import load_cursors, save_cursor
+from app.config import get_settings
 from app.db.database import AsyncSessionLocal
-from app.db.models import Topic, Article, Outlet
+from app.db.models import Topic, Outlet
 
+settings = get_settings()
+
+
+async def _build_scraper() -> ArticleScraper:
+    """
+    One scraper per harvest run, paced by a crawl scheduler from settings,
+    filtering out URLs that are already stored and parsing pages in a
+    process pool.
+    """
+    scheduler = CrawlScheduler(
+        global_concurrency=settings.harvest_global_concurrency,
+        domain_rate=settings.harvest_domain_rate,
+        domain_burst=settings.harvest_domain_burst,
+        domain_max_in_flight=settings.harvest_domain_max_in_flight,
+    )
+    known_urls = await KnownUrlIndex(settings.known_url_window_days).load()
+    print(f"Loaded {len(known_urls)} known article URLs")
+    parser = build_parse_executor(
+        settings.harvest_parse_workers,
+        settings.harvest_parse_max_pending
+    )
+    # Learned HTTP success rates outlive the run; the counters do not
+    fetch_modes = get_fetch_mode_selector(
+        window=settings.fetch_mode_window,
+        min_samples=settings.fetch_mode_min_samples,
+        min_success_rate=settings.fetch_mode_min_success_rate,
+        probe_every=settings.fetch_mode_probe_every,
+    )
+    fetch_modes.reset_stats()
+    # Likewise for proxy sessions: good ones stay sticky across runs
+    proxies = get_proxy_manager()
+    proxies.reset_stats()
+    archive = None
+    if settings.archive_enabled:
+        archive = PageArchive(settings.archive_dir, settings.archive_level)
+        pages, objects = await asyncio.to_thread(archive.prune, settings.archive_retention_days)
+        if pages:
+            print(f"Archive: pruned {pages} pages and {objects} objects past retention")
+    search_cache = None
+    if settings.search_cache_enabled:
+        search_cache = SearchResultCache(
+            settings.redis_url,
+            ttl=settings.search_cache_ttl_seconds,
+            stale_ttl=settings.search_cache_stale_seconds,
+        )
+    return ArticleScraper(
+        scheduler=scheduler,
+        known_urls=known_urls,
+        parser=parser,
+        fetch_modes=fetch_modes,
+        archive=archive,
+        search_cache=search_cache,
+        proxies=proxies
+    )
+
+
+def _print_run_summary(scraper: ArticleScraper) -> None:
+    scraper.scheduler.print_summary()
+    scraper.page_loads.print_summary()
+    scraper.fetch_modes.print_summary()
+    scraper.health.print_summary()
+    scraper.proxies.print_summary()
+    scraper.known_urls.print_summary()
+    if scraper.search_cache:
+        scraper.search_cache.print_summary()
+
+
+async def _close_scraper(scraper: ArticleScraper) -> None:
+    """Release the run's HTTP clients and the shared browser"""
+    await scraper.close()
+    await close_browser_pools()
 
 async def _get_todays_topics() -> list[Topic]:
     """Get today's topics from database"""
@@ -38,89 +124,321 @@ async def _get_or_create_outlet(config: OutletConfig) -> Outlet:
         outlet = result.scalar_one_or_none()
         
         if not outlet:
-            outlet = Outlet(
-                name=config.name,
-                domain=config.domain,
-                monthly_visits=config.monthly_visits,
-                is_wire_service=config.is_wire_service
+            # Concurrent workers may create the same outlet; the loser's
+            # insert is a no-op and both read back the one row
+            await db.execute(
+                insert(Outlet)
+                .values(
+                    name=config.name,
+                    domain=config.domain,
+                    monthly_visits=config.monthly_visits,
+                    is_wire_service=config.is_wire_service
+                )
+                .on_conflict_do_nothing(index_elements=["domain"])
             )
-            db.add(outlet)
             await db.commit()
-            await db.refresh(outlet)
+            result = await db.execute(
+                select(Outlet).where(Outlet.domain == config.domain)
+            )
+            outlet = result.scalar_one()
         
         return outlet
 
 
-async def _store_article(
-    scraped: ScrapedArticle,
-    outlet_id: str,
-    topic_id: str
-) -> bool:
-    """Store scraped article in database"""
-    async with AsyncSessionLocal() as db:
-        # Check if already exists
-        result = await db.execute(
-            select(Article).where(Article.url == scraped.url)
-        )
-        if result.scalar_one_or_none():
-            return False  # Already exists
-        
-        article = Article(
-            outlet_id=outlet_id,
-            topic_id=topic_id,
-            headline=scraped.headline,
-            body=scraped.body,
-            url=scraped.url,
-            author=scraped.author,
-            published_at=scraped.published_at
-        )
-        db.add(article)
-        await db.commit()
-        return True
-
-
-async def _update_topic_count(topic_id: str) -> None:
-    """Update article count for a topic"""
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(Topic).where(Topic.id == topic_id)
-        )
-        topic = result.scalar_one_or_none()
-        if topic:
-            topic.article_count += 1
-            await db.commit()
+async def _outlet_id(config: OutletConfig, outlet_ids: dict[str, str]) -> str:
+    """Outlet id from a per-worker cache, so articles do not each query for it"""
+    outlet_id = outlet_ids.get(config.domain)
+    if outlet_id is None:
+        outlet_id = str((await _get_or_create_outlet(config)).id)
+        outlet_ids[config.domain] = outlet_id
+    return outlet_id
 
 
 async def _harvest_outlet_for_topics(
     outlet_config: OutletConfig,
-    topics: list[Topic]
+    topics: list[Topic],
+    sink: ArticleIngestSink,
+    scraper: ArticleScraper | None = None
 ) -> int:
-    """Harvest articles from one outlet for all topics"""
+    """
+    Harvest articles from one outlet for all topics. Articles are queued
+    on the sink; returns how many were queued.
+    """
     outlet = await _get_or_create_outlet(outlet_config)
-    articles_stored = 0
+    articles_queued = 0
     
     for topic in topics:
         # Use topic name as search query
         articles = await scrape_topic_from_outlet(
             outlet_config,
             topic.name,
-            max_articles=3  # Limit per topic per outlet
+            max_articles=settings.harvest_articles_per_topic,
+            scraper=scraper
         )
         
         for article in articles:
-            stored = await _store_article(
-                article,
-                str(outlet.id),
-                str(topic.id)
+            await sink.add(article, str(outlet.id), str(topic.id))
+        articles_queued += len(articles)
+        
+        # Rate limiting between topics (the scheduler paces requests itself)
+        if not (scraper and scraper.scheduler):
+            await asyncio.sleep(2)
+    
+    return articles_queued
+
+
+async def _sweep_outlet_for_topics(
+    outlet_config: OutletConfig,
+    topics: list[Topic],
+    router: TopicRouter,
+    sink: ArticleIngestSink,
+    scraper: ArticleScraper
+) -> int:
+    """
+    Harvest one outlet by sweeping its feeds and section fronts once and
+    routing each headline to its best matching topic. Outlets without
+    listing pages, or whose listings all fail, fall back to search.
+    """
+    if not (outlet_config.feed_urls or outlet_config.section_urls):
+        return await _harvest_outlet_for_topics(outlet_config, topics, sink, scraper)
+    
+    candidates = await scraper.sweep_outlet(outlet_config)
+    if not candidates:
+        print(f"  No sweep candidates from {outlet_config.domain}, falling back to search")
+        return await _harvest_outlet_for_topics(outlet_config, topics, sink, scraper)
+    
+    print(f"  Swept {len(candidates)} candidates from {outlet_config.domain}")
+    return await _harvest_candidates(outlet_config, candidates, router, sink, scraper)
+
+
+async def _harvest_candidates(
+    outlet_config: OutletConfig,
+    candidates: list[SweepCandidate],
+    router: TopicRouter,
+    sink: ArticleIngestSink,
+    scraper: ArticleScraper,
+    failed: list[str] | None = None
+) -> int:
+    """
+    Route listing candidates to topics, then fetch and queue the articles.
+    Routed URLs that could not be fetched are appended to `failed`.
+    """
+    routed = router.route_all(candidates, settings.harvest_articles_per_topic)
+    print(
+        f"  {sum(map(len, routed.values()))} of {len(candidates)} candidates from "
+        f"{outlet_config.domain} matched {len(routed)} topics"
+    )
+    if not routed:
+        return 0
+    
+    outlet = await _get_or_create_outlet(outlet_config)
+    
+    async def harvest_topic(topic_id: str, urls: list[str]) -> int:
+        articles = await scrape_article_urls(outlet_config, urls, scraper, failed)
+        for article in articles:
+            await sink.add(article, str(outlet.id), topic_id)
+        return len(articles)
+    
+    counts = await asyncio.gather(
+        *(harvest_topic(topic_id, urls) for topic_id, urls in routed.items())
+    )
+    return sum(counts)
+
+
+async def _harvest_outlet(
+    outlet_config: OutletConfig,
+    topics: list[Topic],
+    router: TopicRouter | None,
+    sink: ArticleIngestSink,
+    scraper: ArticleScraper
+) -> int:
+    """Harvest one outlet in the configured discovery mode"""
+    if router is not None:
+        return await _sweep_outlet_for_topics(outlet_config, topics, router, sink, scraper)
+    return await _harvest_outlet_for_topics(outlet_config, topics, sink, scraper)
+
+
+def _build_router(topics: list[Topic]) -> TopicRouter | None:
+    if settings.harvest_discovery_mode == "sweep":
+        return TopicRouter(topics)
+    return None
+
+
+def _build_frontier(run_id: str) -> RedisFrontier:
+    return RedisFrontier(
+        settings.redis_url,
+        run_id,
+        domain_rate=settings.harvest_domain_rate,
+        domain_burst=settings.harvest_domain_burst,
+        domain_max_in_flight=settings.harvest_domain_max_in_flight,
+        lease_ttl=settings.frontier_lease_seconds,
+    )
+
+
+async def _seed_frontier(frontier: RedisFrontier, topics: list[Topic]) -> int:
+    """
+    Queue a run's discovery work: one sweep per outlet in sweep mode,
+    otherwise one search per (outlet, topic). Higher-scored outlets and
+    earlier topics come first.
+    """
+    items = []
+    for rank, outlet_config in enumerate(get_scored_outlets()):
+        if settings.harvest_discovery_mode == "sweep" and (
+            outlet_config.feed_urls or outlet_config.section_urls
+        ):
+            items.append((FrontierItem(SWEEP, outlet_config.domain), rank * 1000))
+            continue
+        for index, topic in enumerate(topics):
+            item = FrontierItem(SEARCH, outlet_config.domain, str(topic.id), query=topic.name)
+            items.append((item, rank * 1000 + index))
+    return await frontier.enqueue_many(items)
+
+
+async def _enqueue_articles(
+    frontier: RedisFrontier,
+    lease: FrontierLease,
+    urls_by_topic: dict[str, list[str]]
+) -> int:
+    """Queue found articles just ahead of the discovery work that found them"""
+    return await frontier.enqueue_many(
+        (FrontierItem(ARTICLE, lease.item.domain, topic_id, url=url), lease.priority - 0.5)
+        for topic_id, urls in urls_by_topic.items()
+        for url in urls
+    )
+
+
+async def _process_frontier_item(
+    lease: FrontierLease,
+    frontier: RedisFrontier,
+    topics: list[Topic],
+    router: TopicRouter,
+    sink: ArticleIngestSink,
+    scraper: ArticleScraper,
+    outlet_ids: dict[str, str]
+) -> bool:
+    item = lease.item
+    config = get_outlet_config(item.domain)
+    if config is None:
+        return False
+    
+    if item.kind == ARTICLE:
+        article = await scraper.scrape_article(item.url, config)
+        if article:
+            await sink.add(article, await _outlet_id(config, outlet_ids), item.topic_id)
+        return article is not None
+    
+    if item.kind == SEARCH:
+        urls = await scraper.search_outlet(
+            config, item.query, settings.harvest_articles_per_topic
+        )
+        urls = await scraper.known_urls.filter_new(urls)
+        await _enqueue_articles(frontier, lease, {item.topic_id: urls})
+        return bool(urls)
+    
+    # SWEEP: route listing headlines; fall back to per-topic searches
+    candidates = await scraper.sweep_outlet(config)
+    if not candidates:
+        await frontier.enqueue_many(
+            (FrontierItem(SEARCH, item.domain, str(topic.id), query=topic.name), lease.priority + index)
+            for index, topic in enumerate(topics)
+        )
+        return False
+    routed = router.route_all(candidates, settings.harvest_articles_per_topic)
+    routed = {
+        topic_id: await scraper.known_urls.filter_new(urls)
+        for topic_id, urls in routed.items()
+    }
+    await _enqueue_articles(frontier, lease, routed)
+    return True
+
+
+@celery_app.task(name="app.tasks.scraping.crawl_frontier")
+def crawl_frontier(run_id: str):
+    """
+    Frontier worker: pull searches, sweeps and article fetches for a
+    harvest run from Redis until the run is drained. Start as many as
+    there are worker processes; per-domain politeness is enforced by the
+    frontier across all of them.
+    """
+    async def run():
+        topics = await _get_todays_topics()
+        frontier = _build_frontier(run_id)
+        router = TopicRouter(topics)
+        scraper = await _build_scraper()
+        sink = ArticleIngestSink(settings.harvest_ingest_batch_size)
+        processed = 0
+        outlet_ids: dict[str, str] = {}
+        # Fetched articles still in the sink's buffer: their leases stay
+        # open until the rows commit, so a worker dying first loses nothing.
+        # They no longer count toward the domain's in-flight cap.
+        held: list[tuple[FrontierLease, float]] = []
+        
+        async def complete_flushed(force: bool = False) -> None:
+            if not held:
+                return
+            # Commit on a clock of its own: a batch may take many domains'
+            # worth of articles to fill, and the leases must not expire
+            if force or time.monotonic() - held[0][1] > settings.frontier_commit_seconds:
+                try:
+                    await sink.flush()
+                except Exception as e:
+                    print(f"  Ingest flush failed, {len(held)} article leases left to expire: {e}")
+                    return
+            if sink.pending:
+                return
+            leases = [lease for lease, _ in held]
+            held.clear()
+            for lease in leases:
+                await frontier.complete(lease, True)
+        
+        async def work() -> None:
+            nonlocal processed
+            while True:
+                lease = await frontier.claim()
+                if lease is None:
+                    # Empty for now, but in-flight discovery may add more
+                    await complete_flushed(force=True)
+                    if not await frontier.active_leases():
+                        return
+                    await asyncio.sleep(1)
+                    continue
+                if isinstance(lease, float):
+                    await complete_flushed()
+                    await asyncio.sleep(min(lease, 1.0))
+                    continue
+                
+                ok = False
+                try:
+                    ok = await _process_frontier_item(
+                        lease, frontier, topics, router, sink, scraper, outlet_ids
+                    )
+                except Exception as e:
+                    print(f"  Error on {lease.item.kind} {lease.item.url or lease.item.domain}: {e}")
+                if ok and lease.item.kind == ARTICLE:
+                    await frontier.fetched(lease)
+                    held.append((lease, time.monotonic()))
+                else:
+                    await frontier.complete(lease, ok)
+                await complete_flushed()
+                processed += 1
+        
+        try:
+            await asyncio.gather(
+                *(work() for _ in range(settings.frontier_worker_concurrency))
             )
-            if stored:
-                articles_stored += 1
-                await _update_topic_count(str(topic.id))
+            await sink.flush()
+            await complete_flushed(force=True)
+        finally:
+            await _close_scraper(scraper)
+            print(f"Frontier {run_id}: {await frontier.stats()}")
+            await frontier.close()
         
-        # Rate limiting between topics
-        await asyncio.sleep(2)
+        _print_run_summary(scraper)
+        sink.print_summary()
+        print(f"Processed {processed} frontier items")
+        return sink.stats.inserted
     
-    return articles_stored
+    return asyncio.run(run())
 
 
 @celery_app.task(name="app.tasks.scraping.harvest_all_outlets")
@@ -139,21 +457,48 @@ def harvest_all_outlets():
         
         print(f"Harvesting for {len(topics)} topics")
         
+        if settings.harvest_frontier_enabled:
+            # Seed the shared frontier and let crawl_frontier workers drain it
+            run_id = RedisFrontier.new_run_id()
+            frontier = _build_frontier(run_id)
+            try:
+                queued = await _seed_frontier(frontier, topics)
+            finally:
+                await frontier.close()
+            for _ in range(settings.frontier_workers):
+                crawl_frontier.delay(run_id)
+            print(f"Frontier {run_id}: {queued} items for {settings.frontier_workers} workers")
+            return queued
+        
         outlets = get_scored_outlets()
-        total_articles = 0
+        scraper = await _build_scraper()
+        sink = ArticleIngestSink(settings.harvest_ingest_batch_size)
+        router = _build_router(topics)
         
-        for outlet_config in outlets:
+        async def harvest_outlet(outlet_config: OutletConfig) -> int:
             print(f"Harvesting {outlet_config.domain}...")
             try:
-                count = await _harvest_outlet_for_topics(outlet_config, topics)
-                total_articles += count
-                print(f"  Stored {count} articles from {outlet_config.domain}")
+                count = await _harvest_outlet(
+                    outlet_config, topics, router, sink, scraper
+                )
+                print(f"  Queued {count} articles from {outlet_config.domain}")
+                return count
             except Exception as e:
                 print(f"  Error harvesting {outlet_config.domain}: {e}")
-            
-            # Rate limiting between outlets
-            await asyncio.sleep(5)
+                return 0
+        
+        # All outlets run at once; per-domain politeness is enforced by the scheduler
+        try:
+            await asyncio.gather(
+                *(harvest_outlet(outlet_config) for outlet_config in outlets)
+            )
+            await sink.flush()
+        finally:
+            await _close_scraper(scraper)
+        total_articles = sink.stats.inserted
         
+        _print_run_summary(scraper)
+        sink.print_summary()
         print(f"[{datetime.utcnow()}] Harvesting complete. Total: {total_articles} articles")
         return total_articles
     
@@ -163,8 +508,6 @@ def harvest_all_outlets():
 @celery_app.task(name="app.tasks.scraping.harvest_single_outlet")
 def harvest_single_outlet(domain: str):
     """Harvest articles from a single outlet"""
-    from app.scraper.outlets import get_outlet_config
-    
     async def run():
         config = get_outlet_config(domain)
         if not config:
@@ -175,7 +518,69 @@ def harvest_single_outlet(domain: str):
         if not topics:
             return 0
         
-        return await _harvest_outlet_for_topics(config, topics)
+        scraper = await _build_scraper()
+        sink = ArticleIngestSink(settings.harvest_ingest_batch_size)
+        try:
+            await _harvest_outlet(config, topics, _build_router(topics), sink, scraper)
+            await sink.flush()
+        finally:
+            await _close_scraper(scraper)
+        _print_run_summary(scraper)
+        sink.print_summary()
+        return sink.stats.inserted
+    
+    return asyncio.run(run())
+
+
+@celery_app.task(name="app.tasks.scraping.harvest_sitemaps")
+def harvest_sitemaps():
+    """
+    Incremental crawl: route articles that are new or changed in each
+    outlet's news sitemap since its last high-water mark to today's
+    topics. Runs every 30 minutes.
+    """
+    async def run():
+        topics = await _get_todays_topics()
+        if not topics:
+            # Nothing to route to yet; leave the marks where they are
+            return 0
+        
+        outlets = [c for c in get_scored_outlets() if c.sitemap_urls]
+        cursors = await load_cursors()
+        router = TopicRouter(topics)
+        scraper = await _build_scraper()
+        sink = ArticleIngestSink(settings.harvest_ingest_batch_size)
+        
+        async def crawl_outlet(outlet_config: OutletConfig) -> None:
+            try:
+                sweep = await scraper.sitemap_outlet(
+                    outlet_config, cursors.get(outlet_config.domain)
+                )
+                print(
+                    f"Sitemaps for {outlet_config.domain}: {sweep.fetched} fetched, "
+                    f"{len(sweep.candidates)}/{sweep.entries_seen} entries new"
+                )
+                failed: list[str] = []
+                await _harvest_candidates(
+                    outlet_config, sweep.candidates, router, sink, scraper, failed
+                )
+                await sink.flush()
+                # Stop short of anything not fetched so the next run retries it
+                await save_cursor(outlet_config.domain, sweep.high_water_mark(failed))
+            except Exception as e:
+                print(f"  Error crawling sitemaps for {outlet_config.domain}: {e}")
+        
+        try:
+            await asyncio.gather(
+                *(crawl_outlet(outlet_config) for outlet_config in outlets)
+            )
+            await sink.flush()
+        finally:
+            await _close_scraper(scraper)
+        
+        _print_run_summary(scraper)
+        sink.print_summary()
+        return sink.stats.inserted
     
     return asyncio.run(run())
 